@@ -4,33 +4,48 @@ Preview Maker - Finds interesting details in images
 using Google Gemini AI and creates a zoomed-in circular overlay with magnification.
 """
 
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import io
+import math
 import os
+import queue
 import sys
 import time
 import threading
 import subprocess
+import logging
 import gi
 import toml
 
 # Set required versions before importing
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
+gi.require_version("Gsk", "4.0")
+gi.require_version("Graphene", "1.0")
+gi.require_version("Pango", "1.0")
 gi.require_version("Notify", "0.7")
 
 # Add the src directory to the path if running from the root
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 # GTK imports
-from gi.repository import Gtk, Gdk, GdkPixbuf, GLib, Gio, Notify
+from gi.repository import Gtk, Gdk, GLib, Gio, Graphene, Gsk, Notify, Pango
 
 # Image processing imports
-from PIL import Image
+from PIL import Image, UnidentifiedImageError, __version__ as PIL_VERSION
 
 # Import our custom modules
 import gemini_analyzer
 import image_processor
 import config
 
+# Per-image diagnostics go through logging instead of print() so they cost
+# nothing unless enabled, e.g. PREVIEW_MAKER_LOG=DEBUG
+logger = logging.getLogger("preview_maker")
+
 # Check for optional dependencies
 try:
     import google.generativeai as genai
@@ -50,14 +65,343 @@ PROMPTS_DIR = config.get_path("prompts_dir")
 DEFAULT_PROMPT_FILE = config.get_path("default_prompt_file")
 TECHNICAL_PROMPT_FILE = config.get_path("technical_prompt_file")
 DEFAULT_TARGET_TYPE = config.get_default_target_type()
+# Lower-cased extensions without the leading dot, see _is_image_file()
+IMAGE_EXTENSIONS = frozenset(
+    ext.lower().lstrip(".") for ext in config.get_supported_formats()
+)
+# Slider settings are saved once the slider has been still this long (ms)
+SLIDER_SAVE_DELAY = 300
+# Shown when Gemini returns no usable box; it has its own, longer cooldown,
+# which is reset once a valid box comes back
+GEMINI_BOX_FAILED_MESSAGE = "Gemini API failed to provide a valid bounding box"
+# Seconds before an identical notification is shown again, by default and
+# for messages containing one of the given texts
+NOTIFICATION_COOLDOWN = 1
+NOTIFICATION_COOLDOWNS = (
+    (GEMINI_BOX_FAILED_MESSAGE, 10),
+    ("Erkennung abgeschlossen", 5),  # Detection finished
+)
+# Distinct notification messages remembered for rate limiting
+NOTIFICATION_HISTORY = 32
+# Processed outputs and Gemini results remembered, least recently used
+# dropped first
+RESULT_HISTORY = 1024
+# Upper bound on paths waiting to be processed; the directory scan blocks
+# when the queue is full, so huge drops don't hold every path in memory
+IMAGE_QUEUE_SIZE = 256
+# Images processed concurrently; each worker decodes its own image, so
+# decoding and Gemini requests of different images overlap
+IMAGE_WORKERS = min(os.cpu_count() or 1, 4)
+# Larger files are decoded straight from disk instead of being read into
+# memory first, so their encoded and decoded forms aren't both resident
+MAX_BUFFERED_FILE_SIZE = 64 * 1024 * 1024
+# Longest edge of the copy uploaded to Gemini; the boxes it returns are
+# scaled back to the full image
+MAX_GEMINI_EDGE = 1024
+
+# Overlay colours, created once instead of on every redraw
+IMAGE_AREA_COLOR = Gdk.RGBA(0.1, 0.1, 0.1, 0.05)  # Very subtle rectangle
+MAGNIFICATION_COLOR = Gdk.RGBA(0, 1, 0, 0.5)  # Green, semi-transparent
+PREVIEW_COLOR = Gdk.RGBA(0, 0, 1, 0.5)  # Blue, semi-transparent
+CONNECTOR_COLOR = Gdk.RGBA(1, 0.5, 0, 0.7)  # Orange, semi-transparent
+API_BOX_COLORS = [Gdk.RGBA(0, 0.5, 1, 0.6)] * 4  # Blue outline, one per side
+API_BOX_WIDTHS = [2.0] * 4
+API_LABEL_COLOR = Gdk.RGBA(0, 0.5, 1, 0.8)  # Brighter blue for text
+ERROR_LABEL_COLOR = Gdk.RGBA(0.8, 0, 0, 0.7)  # Red background
+LABEL_TEXT_COLOR = Gdk.RGBA(1, 1, 1, 1)  # White text
 
 # Ensure prompt files exist
 config.ensure_prompt_files()
 
 
+def _is_image_file(file_name):
+    """Check whether a file name has one of the supported image extensions."""
+    _, dot, ext = file_name.rpartition(".")
+    return bool(dot) and ext.lower() in IMAGE_EXTENSIONS
+
+
+def _log_pillow_backend():
+    """Log whether Pillow or the SIMD-accelerated Pillow-SIMD fork is in use.
+
+    Pillow-SIMD is a drop-in replacement with the same API; its releases
+    carry a ".postN" suffix on the Pillow version they are based on.
+    """
+    backend = "Pillow-SIMD" if "post" in PIL_VERSION else "Pillow"
+    logger.info("Image backend: %s %s", backend, PIL_VERSION)
+
+
+def _read_image_file(image_path):
+    """Read a whole image file with a single buffered read.
+
+    Pillow reads files in many small chunks while decoding; reading the
+    whole file up front, with a sequential-access hint where supported,
+    lets the kernel prefetch it. This mainly helps large JPEGs on slow or
+    network storage.
+
+    Returns:
+        bytes: The file's contents, or None if the file is larger than
+            MAX_BUFFERED_FILE_SIZE
+    """
+    with open(image_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > MAX_BUFFERED_FILE_SIZE:
+            return None
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f.read()
+
+
+def _content_digest(image_path, data=None):
+    """Return a BLAKE2b digest of an image file's contents.
+
+    Args:
+        image_path: Path of the image file
+        data: The file's contents from _read_image_file(), if it returned any;
+            otherwise the file is hashed in chunks
+    """
+    if data is not None:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(image_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _read_default_prompt():
+    """Return the prompt used for automatic detection, or None if unset.
+
+    gemini_analyzer reads its prompt from DEFAULT_PROMPT_FILE, so the
+    file's text decides what an automatic detection asks for.
+    """
+    try:
+        with open(DEFAULT_PROMPT_FILE, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _gemini_key(digest, *args):
+    """Identify a Gemini request by image content and the prompt it uses.
+
+    Args:
+        digest: Digest of the image file from _content_digest()
+        *args: Extra arguments for _identify_area()
+
+    Returns:
+        tuple: Digest, the extra arguments and the default prompt text, which
+            gemini_analyzer falls back to when no custom prompt is given
+    """
+    return (digest, args, _read_default_prompt())
+
+
+def _open_image(image_path, data=None):
+    """Open an image from the contents of its file.
+
+    Args:
+        image_path: Path of the image file
+        data: The file's contents, if already read with _read_image_file()
+    """
+    if data is None:
+        data = _read_image_file(image_path)
+    if data is None:
+        # Too large to buffer; Pillow reads the file as it decodes
+        return Image.open(image_path)
+    try:
+        return Image.open(io.BytesIO(data))
+    except UnidentifiedImageError:
+        # Name the file instead of the in-memory buffer in the message
+        raise UnidentifiedImageError(
+            f"cannot identify image file {image_path!r}"
+        ) from None
+
+
+def _decode_image(image_path, data=None):
+    """Open and fully decode an image (runs off the main thread)."""
+    image = _open_image(image_path, data)
+    image.load()
+    return image
+
+
+def _to_rgb(image):
+    """Return an RGB (or greyscale) version of an image for the Gemini API.
+
+    Images that are already RGB or L are returned as they are; otherwise
+    convert() produces the one new copy that is needed.
+    """
+    if image.mode in ("RGB", "L"):
+        return image
+    return image.convert("RGB")
+
+
+def _gemini_input(image):
+    """Return the copy of an image that is sent to the Gemini API.
+
+    Images with an edge longer than MAX_GEMINI_EDGE are scaled down first,
+    which shrinks the upload and the work on the server side.
+    """
+    scale = MAX_GEMINI_EDGE / max(image.size)
+    if scale < 1:
+        if image.mode in ("P", "1"):
+            # These modes can only be resized with nearest-neighbour sampling
+            image = image.convert("RGB")
+        image = image.resize(
+            (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+            Image.BILINEAR,
+            reducing_gap=2.0,
+        )
+    return _to_rgb(image)
+
+
+def _scale_box(box, scale, size):
+    """Map a box returned for a _gemini_input() copy back to the original.
+
+    Args:
+        box: (x1, y1, x2, y2) in the coordinates of the scaled copy, or None
+        scale: Width of the scaled copy divided by that of the original
+        size: (width, height) of the original image
+    """
+    if not box or scale == 1:
+        return box
+    width, height = size
+    x1, y1, x2, y2 = box
+    return (
+        max(0, min(width, int(x1 / scale))),
+        max(0, min(height, int(y1 / scale))),
+        max(0, min(width, round(x2 / scale))),
+        max(0, min(height, round(y2 / scale))),
+    )
+
+
+def _identify_area(image, *args, full_size=None):
+    """Ask Gemini for the interesting area of an image.
+
+    Args:
+        image: The image, or a reduced-size decode of it
+        *args: Extra arguments for identify_interesting_textile()
+        full_size: (width, height) of the full image, if image is reduced
+
+    Returns:
+        tuple: (interesting_area, raw_box, description), with both boxes in
+            the pixel coordinates of the full image
+    """
+    full_size = full_size or image.size
+    gemini_image = _gemini_input(image)
+    scale = gemini_image.width / full_size[0]
+
+    interesting_area, raw_box, description = (
+        gemini_analyzer.identify_interesting_textile(gemini_image, *args)
+    )
+    return (
+        _scale_box(interesting_area, scale, full_size),
+        _scale_box(raw_box, scale, full_size),
+        description,
+    )
+
+
+def _identify_area_from_jpeg(image_path, data):
+    """Run _identify_area() on a reduced-size decode of a JPEG file.
+
+    libjpeg can decode at 1/2, 1/4 or 1/8 scale (see Image.draft()), which
+    is far cheaper than the full decode, so the Gemini request can start
+    while the full-size image is still being decoded.
+    """
+    image = _open_image(image_path, data)
+    full_size = image.size
+    image.draft(image.mode, (MAX_GEMINI_EDGE, MAX_GEMINI_EDGE))
+    with image:
+        return _identify_area(image, full_size=full_size)
+
+
+def _load_debug_mode():
+    """Read ui.debug_mode from the config file.
+
+    Returns:
+        bool: The configured debug mode, or False if the file or the
+            setting doesn't exist or can't be read
+    """
+    try:
+        with open(config.CONFIG_PATH, "r") as f:
+            debug_mode = bool(toml.load(f).get("ui", {}).get("debug_mode", False))
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.warning("Could not read debug mode from config: %s", e)
+        return False
+
+    logger.info("Loaded debug mode from config: %s", debug_mode)
+    return debug_mode
+
+
+class CircleOverlay(Gtk.Widget):
+    """Transparent overlay widget that draws through GtkSnapshot.
+
+    Render nodes are composited by the GPU renderer, unlike a Cairo draw
+    func which is rasterized on the CPU and then uploaded every frame.
+    """
+
+    def __init__(self, draw_func):
+        """
+        Args:
+            draw_func: Called as draw_func(widget, snapshot, width, height)
+        """
+        super().__init__()
+        self._draw_func = draw_func
+
+    def do_snapshot(self, snapshot):
+        self._draw_func(self, snapshot, self.get_width(), self.get_height())
+
+
+def _rect(x, y, width, height):
+    """Create a Graphene.Rect."""
+    return Graphene.Rect().init(x, y, width, height)
+
+
+def _append_circle(snapshot, x, y, radius, color):
+    """Append a filled circle centred on (x, y) to a snapshot."""
+    bounds = _rect(x - radius, y - radius, 2 * radius, 2 * radius)
+    clip = Gsk.RoundedRect()
+    clip.init_from_rect(bounds, radius)
+    snapshot.push_rounded_clip(clip)
+    snapshot.append_color(color, bounds)
+    snapshot.pop()
+
+
+def _append_line(snapshot, x1, y1, x2, y2, line_width, color):
+    """Append a straight line from (x1, y1) to (x2, y2) to a snapshot."""
+    snapshot.save()
+    snapshot.translate(Graphene.Point().init(x1, y1))
+    snapshot.rotate(math.degrees(math.atan2(y2 - y1, x2 - x1)))
+    snapshot.append_color(
+        color, _rect(0, -line_width / 2, math.hypot(x2 - x1, y2 - y1), line_width)
+    )
+    snapshot.restore()
+
+
+@functools.lru_cache(maxsize=None)
+def _font_description(font):
+    """Parse a Pango font string; the few fonts in use are parsed only once."""
+    return Pango.FontDescription.from_string(font)
+
+
+def _append_text(snapshot, widget, text, font, x, y, color):
+    """Append a line of text with its top-left corner at (x, y) to a snapshot."""
+    layout = widget.create_pango_layout(text)
+    layout.set_font_description(_font_description(font))
+    snapshot.save()
+    snapshot.translate(Graphene.Point().init(x, y))
+    snapshot.append_layout(layout, color)
+    snapshot.restore()
+
+
 class PreviewMaker(Gtk.Application):
     """Main application class for the Preview Maker."""
 
+    # Application stylesheet, parsed once and shared by every window
+    _css_provider = None
+    # Display the stylesheet has been registered with
+    _css_display = None
+
     def __init__(self):
         # Use 0 for FLAGS_NONE to avoid attribute error
         super().__init__(
@@ -80,14 +424,55 @@ class PreviewMaker(Gtk.Application):
             None  # For on-screen display with debug overlay
         )
         self.processing = False
-        self.image_queue = []
+        self.image_queue = None  # Bounded queue.Queue of paths for the current drop
+        self._queued_count = 0  # Paths found so far by the directory scan
+        self._processed_count = 0  # Images finished from the current drop
+        self._progress_percent = -1  # Last progress percentage shown
+        # Incremented for every drop; jobs of an older drop are ignored by
+        # _post_ui_update(), so they don't count towards the current one
+        self._batch_id = 0
+        # Output of each processed image, keyed by _job_key(), so identical
+        # files dropped again with the same settings and prompt are not
+        # processed a second time
+        self._processed_outputs = collections.OrderedDict()
+        # Gemini result (interesting_area, raw_box, description) keyed by
+        # _gemini_key(), so re-dropping a file with other settings or
+        # re-running the same detection doesn't ask the API again
+        self._gemini_results = collections.OrderedDict()
+        # Guards both of the above, which the image workers share; each is
+        # capped at RESULT_HISTORY entries, see _remember()
+        self._results_lock = threading.Lock()
+        # Persistent worker pool that processes dropped images
+        self._image_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=IMAGE_WORKERS, thread_name_prefix="image-worker"
+        )
+        # Gemini requests made on behalf of the image workers, so they can
+        # overlap with decoding the full-size image
+        self._gemini_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=IMAGE_WORKERS, thread_name_prefix="gemini"
+        )
+        # Writes settings to the config file off the main loop; a single
+        # thread keeps the writes in order, see _save_config()
+        self._config_writer = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-writer"
+        )
+        # UI state posted by worker threads, applied by one idle callback;
+        # see _post_ui_update()
+        self._ui_lock = threading.Lock()
+        self._pending_ui = {}
+        self._idle_update_pending = False
         self.current_image_path = None
         self.current_dir = None
         self.notification = None  # Will hold the current libnotify notification
         # For tracking active notifications
         self.last_notification_id = None
-        # For tracking specific notifications to prevent flooding
-        self._notification_timestamps = {}
+        # When each recent message may be shown again, to prevent flooding;
+        # least recently shown first, capped at NOTIFICATION_HISTORY
+        self._notification_deadlines = collections.OrderedDict()
+        # Source id of the pending status bar clear, 0 if none is scheduled
+        self._notification_timer_id = 0
+        # Source id of the pending slider settings save, 0 if none is scheduled
+        self._slider_save_id = 0
         # Store normalized coordinates (0-1) instead of pixels
         self.selected_magnification_point_norm = None
         self.selected_preview_point_norm = None
@@ -96,32 +481,41 @@ class PreviewMaker(Gtk.Application):
         self.selected_preview_point = None
         self.window = None
         self.progress_bar = None
+        self.status_bar = None
         self.spinner = None
         self.circle_area = None
+        # Preview of the last processed image and the buttons disabled while
+        # processing, if the current layout has them
+        self.output_picture = None
+        self.buttons = []
+        # Manual mode widgets, created with the manual mode window
+        self.prompt_entry_view = None
+        self.description_label = None
+        # Placeholder state of the prompt view without a view_id
+        self.is_placeholder_visible = False
+        self.placeholder_text = "[Standard]"
+        # Source id of the detection run when the manual window opens
+        self._auto_detection_timer = None
+        # Last bounding box returned by Gemini and the prompt used for it
+        self.gemini_box = None
+        self.custom_prompt = None
+        # Cached image-to-widget mapping, see _get_display_transform()
+        self._transform = None
         # Track original image dimensions
         self.original_img_width = 0
         self.original_img_height = 0
+        # Point and size of the image of the last Gemini box, for debugging
+        # and for scaling the box to the display; None until a detection ran
+        self.original_mag_x = None
+        self.original_mag_y = None
+        self.original_width = None
+        self.original_height = None
         # Configurable parameters for circle sizes
         self.selection_ratio = config.get_image_processing("selection_ratio")
         self.zoom_factor = config.get_image_processing("zoom_factor")
 
         # Load debug mode from config if it exists
-        try:
-            import toml
-
-            config_path = config.CONFIG_PATH
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    cfg = toml.load(f)
-                # Check if UI section with debug_mode exists
-                if "ui" in cfg and "debug_mode" in cfg["ui"]:
-                    self.debug_mode = cfg["ui"]["debug_mode"]
-                    print(f"Loaded debug mode from config: {self.debug_mode}")
-                else:
-                    self.debug_mode = False  # Default to debug mode off
-        except Exception:
-            # Default to debug mode off if can't load from config
-            self.debug_mode = False
+        self.debug_mode = _load_debug_mode()
 
         # Store the description from Gemini
         self.gemini_description = None
@@ -129,20 +523,31 @@ class PreviewMaker(Gtk.Application):
         # Ensure desktop file exists for proper notifications
         self._ensure_desktop_file()
 
-    def debug_print(self, *args, **kwargs):
-        """Print debug information only when debug mode is enabled"""
+    def debug_print(self, message, *args):
+        """Print debug information only when debug mode is enabled.
+
+        Like the logging calls, the message is %-formatted with args lazily,
+        so nothing is formatted while debug mode is off.
+        """
         if self.debug_mode:
-            print(*args, **kwargs)
+            print(message % args if args else message)
 
     def on_activate(self, app):
         """Primary method to set up the UI when the application starts."""
+        # Launching the app again activates the running instance; bring the
+        # existing window forward instead of building another one
+        if self.window is not None:
+            self.window.present()
+            return
+
         # Create the main window
         self.window = Gtk.ApplicationWindow(application=app)
         self.window.set_title("Preview Maker")
         self.window.set_default_size(800, 600)
 
-        # Initialize libnotify again here to ensure it's ready
-        Notify.init("Vorschau-Ersteller")
+        # libnotify is initialized in __init__; only retry if that failed
+        if not Notify.is_initted():
+            Notify.init("Vorschau-Ersteller")
 
         # Set up all CSS providers
         self._setup_css_providers()
@@ -198,91 +603,18 @@ class PreviewMaker(Gtk.Application):
         # Set fixed size for drop box
         drop_box.set_size_request(350, 250)
 
-        # Automatic mode drop area
-        auto_drop_area = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        auto_drop_area.set_size_request(150, 150)
-        auto_drop_area.set_hexpand(True)
-        auto_drop_area.set_vexpand(True)
-        auto_drop_area.set_halign(Gtk.Align.CENTER)
-        auto_drop_area.set_valign(Gtk.Align.CENTER)
-
-        # Center the icon in the auto drop area
-        auto_icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        auto_icon_box.set_halign(Gtk.Align.CENTER)
-        auto_icon_box.set_valign(Gtk.Align.CENTER)
-        auto_icon_box.set_vexpand(True)
-
-        auto_icon = Gtk.Image.new_from_icon_name("media-playback-start")
-        auto_icon.set_pixel_size(48)  # Larger icon
-        auto_label = Gtk.Label(label="Automatischer Modus")
-        auto_label.set_margin_top(10)
-
-        auto_icon_box.append(auto_icon)
-        auto_icon_box.append(auto_label)
-        auto_drop_area.append(auto_icon_box)
-        drop_box.append(auto_drop_area)
-
-        # Manual mode drop area
-        manual_drop_area = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        manual_drop_area.set_size_request(150, 150)
-        manual_drop_area.set_hexpand(True)
-        manual_drop_area.set_vexpand(True)
-        manual_drop_area.set_halign(Gtk.Align.CENTER)
-        manual_drop_area.set_valign(Gtk.Align.CENTER)
-
-        # Center the icon in the manual drop area
-        manual_icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        manual_icon_box.set_halign(Gtk.Align.CENTER)
-        manual_icon_box.set_valign(Gtk.Align.CENTER)
-        manual_icon_box.set_vexpand(True)
-
-        manual_icon = Gtk.Image.new_from_icon_name("preferences-system")
-        manual_icon.set_pixel_size(48)  # Larger icon
-        manual_label = Gtk.Label(label="Manueller Modus")
-        manual_label.set_margin_top(10)
-
-        manual_icon_box.append(manual_icon)
-        manual_icon_box.append(manual_label)
-        manual_drop_area.append(manual_icon_box)
-        drop_box.append(manual_drop_area)
-
-        # Add background color styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(
-            b"""
-        box {
-            background-color: #333333;
-            border-radius: 8px;
-        }
-        .mode-label {
-            color: white;
-            font-weight: bold;
-        }
-        """
+        # One drop area per mode
+        drop_box.append(
+            self._make_drop_area(
+                "media-playback-start", "Automatischer Modus", self.on_auto_drop
+            )
         )
-
-        # Get the style context for the display
-        display = Gdk.Display.get_default()
-        Gtk.StyleContext.add_provider_for_display(
-            display,
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        drop_box.append(
+            self._make_drop_area(
+                "preferences-system", "Manueller Modus", self.on_manual_drop
+            )
         )
 
-        # Add CSS classes
-        auto_label.add_css_class("mode-label")
-        manual_label.add_css_class("mode-label")
-
-        # Set up drag and drop functionality for automatic mode
-        auto_drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
-        auto_drop_target.connect("drop", self.on_auto_drop)
-        auto_drop_area.add_controller(auto_drop_target)
-
-        # Set up drag and drop functionality for manual mode
-        manual_drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
-        manual_drop_target.connect("drop", self.on_manual_drop)
-        manual_drop_area.add_controller(manual_drop_target)
-
         # Add the drop box directly to the main vbox
         vbox.append(drop_box)
 
@@ -300,28 +632,6 @@ class PreviewMaker(Gtk.Application):
         # Force size calculation
         GLib.timeout_add(100, self._fix_window_size)
 
-        # Add CSS provider for basic styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(
-            b"""
-            .heading {
-                font-size: 20px;
-                font-weight: bold;
-            }
-            .desc-text {
-                font-size: 14px;
-                line-height: 1.3;
-            }
-            """,
-            -1,  # Length parameter, -1 means auto-detect length
-        )
-
-        # Apply the CSS provider to the display
-        display = Gdk.Display.get_default()
-        Gtk.StyleContext.add_provider_for_display(
-            display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
-
     def _fix_window_size(self):
         """Fix the window size after initial layout."""
         if not self.window:
@@ -375,60 +685,119 @@ X-GNOME-UsesNotifications=true
         except Exception as e:
             print(f"Warning: Could not create desktop file: {e}")
 
-    def on_draw_circles(self, widget, cr, width, height):
-        """Draw circles on the overlay using Cairo."""
-        if not self.current_image:
-            return
+    def _get_display_transform(self, width, height):
+        """
+        Get the mapping from image coordinates to overlay widget coordinates.
 
-        # Get the actual image dimensions
-        img_width, img_height = self.current_image.size
+        The image is shown letterboxed with its aspect ratio preserved, so
+        the mapping only changes when the widget is resized, another image
+        is loaded or the circle sizes are changed; it is cached instead of
+        recomputed every frame.
 
-        self.debug_print(f"Drawing area dimensions: {width}x{height}")
-        self.debug_print(f"Image dimensions: {img_width}x{img_height}")
-        self.debug_print(
-            f"Magnification point (normalized): {self.selected_magnification_point_norm}"
-        )
-        self.debug_print(
-            f"Preview point (normalized): {self.selected_preview_point_norm}"
-        )
+        Args:
+            width: Current width of the overlay widget
+            height: Current height of the overlay widget
 
-        # First determine the actual image display size within the drawing area
-        # (this accounts for aspect ratio preservation)
-        display_ratio = img_width / img_height
-        widget_ratio = width / height
+        Returns:
+            dict: Displayed image size ("width", "height"), scale from
+            original pixels ("scale_x", "scale_y") and the letterboxing
+            offsets ("x_offset", "y_offset"), plus the on-screen radii of the
+            magnification and preview circles ("mag_radius", "preview_radius")
+        """
+        img_width, img_height = self.current_image.size
+        key = (
+            width,
+            height,
+            img_width,
+            img_height,
+            self.selection_ratio,
+            self.zoom_factor,
+        )
+        if self._transform is not None and self._transform["key"] == key:
+            return self._transform
 
-        if display_ratio > widget_ratio:
+        # Determine the actual image display size within the widget
+        if img_width / img_height > width / height:
             # Image is wider than widget - width constrained
             image_display_width = width
-            image_display_height = width / display_ratio
+            image_display_height = width * img_height / img_width
         else:
             # Image is taller than widget - height constrained
             image_display_height = height
-            image_display_width = height * display_ratio
+            image_display_width = height * img_width / img_height
 
-        # Calculate the scaling factor from original image to current display
+        # The selection circle size is based on the image dimensions
         scale_x = image_display_width / img_width
-        scale_y = image_display_height / img_height
+        highlight_diameter = int(min(img_width, img_height) * self.selection_ratio)
+        mag_radius = highlight_diameter / 2 * scale_x
+
+        self._transform = {
+            "key": key,
+            "width": image_display_width,
+            "height": image_display_height,
+            "scale_x": scale_x,
+            "scale_y": image_display_height / img_height,
+            # Letterboxing/pillarboxing offsets to center the image
+            "x_offset": (width - image_display_width) / 2,
+            "y_offset": (height - image_display_height) / 2,
+            "mag_radius": mag_radius,
+            # The preview circle is the highlight times the zoom factor
+            "preview_radius": mag_radius * self.zoom_factor,
+        }
+        return self._transform
 
-        # Calculate letterboxing/pillarboxing offsets to center the image
-        x_offset = (width - image_display_width) / 2
-        y_offset = (height - image_display_height) / 2
+    def on_draw_circles(self, widget, snapshot, width, height):
+        """Draw circles on the overlay as GSK render nodes."""
+        if not self.current_image:
+            return
 
-        self.debug_print(
-            f"Image display size: {image_display_width}x{image_display_height}"
+        # Get the actual image dimensions
+        img_width, img_height = self.current_image.size
+
+        logger.debug("Drawing area dimensions: %sx%s", width, height)
+        logger.debug("Image dimensions: %sx%s", img_width, img_height)
+        logger.debug(
+            "Magnification point (normalized): %s",
+            self.selected_magnification_point_norm,
         )
-        self.debug_print(f"Scale factors: {scale_x}, {scale_y}")
-        self.debug_print(f"Offsets: {x_offset}, {y_offset}")
+        logger.debug("Preview point (normalized): %s", self.selected_preview_point_norm)
+
+        # Map from the original image to the current display
+        transform = self._get_display_transform(width, height)
+        image_display_width = transform["width"]
+        image_display_height = transform["height"]
+        scale_x = transform["scale_x"]
+        scale_y = transform["scale_y"]
+        x_offset = transform["x_offset"]
+        y_offset = transform["y_offset"]
+
+        logger.debug(
+            "Image display size: %sx%s", image_display_width, image_display_height
+        )
+        logger.debug("Scale factors: %s, %s", scale_x, scale_y)
+        logger.debug("Offsets: %s, %s", x_offset, y_offset)
 
         # Draw the effective image area (for debugging)
-        cr.set_source_rgba(0.1, 0.1, 0.1, 0.05)  # Very subtle rectangle
-        cr.rectangle(x_offset, y_offset, image_display_width, image_display_height)
-        cr.fill()
+        snapshot.append_color(
+            IMAGE_AREA_COLOR,
+            _rect(x_offset, y_offset, image_display_width, image_display_height),
+        )
 
-        # Calculate the selection circle size based on the image dimensions
-        shortest_dimension = min(img_width, img_height)
-        highlight_diameter = int(shortest_dimension * self.selection_ratio)
-        highlight_radius = highlight_diameter / 2
+        # Map both points from normalized coordinates to pixel positions on
+        # the displayed image once; the circles and the connecting line share them
+        mag_draw = prev_draw = None
+        if self.selected_magnification_point_norm:
+            norm_x, norm_y = self.selected_magnification_point_norm
+            mag_draw = (
+                x_offset + norm_x * image_display_width,
+                y_offset + norm_y * image_display_height,
+            )
+        if self.selected_preview_point_norm:
+            norm_x, norm_y = self.selected_preview_point_norm
+            prev_draw = (
+                x_offset + norm_x * image_display_width,
+                y_offset + norm_y * image_display_height,
+            )
 
         # Check if we have valid normalized points for the magnification circle
         if (
@@ -442,32 +811,31 @@ X-GNOME-UsesNotifications=true
             norm_x, norm_y = self.selected_magnification_point_norm
 
             # Additional debug info to troubleshoot coordinate issues
-            if hasattr(self, "original_mag_x") and hasattr(self, "original_width"):
-                print(
-                    f"DEBUG COORDS: Original mag point: ({self.original_mag_x}, {self.original_mag_y})"
-                )
-                print(
-                    f"DEBUG COORDS: Original image dimensions: "
-                    f"{self.original_width}x{self.original_height}"
+            if self.original_width is not None:
+                logger.debug(
+                    "Original mag point: (%s, %s)",
+                    self.original_mag_x,
+                    self.original_mag_y,
                 )
-                print(
-                    f"DEBUG COORDS: Display image dimensions: {img_width}x{img_height}"
+                logger.debug(
+                    "Original image dimensions: %sx%s",
+                    self.original_width,
+                    self.original_height,
                 )
-                print(f"DEBUG COORDS: Drawing at normalized: ({norm_x}, {norm_y})")
+                logger.debug("Display image dimensions: %sx%s", img_width, img_height)
+                logger.debug("Drawing at normalized: (%s, %s)", norm_x, norm_y)
 
-            # Map from normalized coordinates to pixel positions on displayed image
-            draw_x = x_offset + (norm_x * image_display_width)
-            draw_y = y_offset + (norm_y * image_display_height)
-
-            self.debug_print(f"Drawing magnification circle at: ({draw_x}, {draw_y})")
+            draw_x, draw_y = mag_draw
+            logger.debug("Drawing magnification circle at: (%s, %s)", draw_x, draw_y)
 
             # Draw the magnification circle (green)
-            cr.set_source_rgba(0, 1, 0, 0.5)  # Green, semi-transparent
-
-            # Scale the radius based on viewport scale - use the configurable selection size
-            circle_radius = highlight_radius * scale_x
-            cr.arc(draw_x, draw_y, circle_radius, 0, 2 * 3.14)
-            cr.fill()
+            _append_circle(
+                snapshot,
+                draw_x,
+                draw_y,
+                transform["mag_radius"],
+                MAGNIFICATION_COLOR,
+            )
 
             # Update pixel coordinates based on current viewport
             pixel_x = int(norm_x * img_width)
@@ -483,20 +851,17 @@ X-GNOME-UsesNotifications=true
             # Convert normalized coordinates to viewport coordinates
             norm_x, norm_y = self.selected_preview_point_norm
 
-            # Map from normalized coordinates to pixel positions on displayed image
-            draw_x = x_offset + (norm_x * image_display_width)
-            draw_y = y_offset + (norm_y * image_display_height)
-
-            self.debug_print(f"Drawing preview circle at: ({draw_x}, {draw_y})")
+            draw_x, draw_y = prev_draw
+            logger.debug("Drawing preview circle at: (%s, %s)", draw_x, draw_y)
 
             # Draw the preview circle (blue)
-            cr.set_source_rgba(0, 0, 1, 0.5)  # Blue, semi-transparent
-
-            # Scale the radius based on viewport scale - use configurable zoom factor
-            # The preview circle radius is the highlight radius times the zoom factor
-            circle_radius = highlight_radius * self.zoom_factor * scale_x
-            cr.arc(draw_x, draw_y, circle_radius, 0, 2 * 3.14)
-            cr.fill()
+            _append_circle(
+                snapshot,
+                draw_x,
+                draw_y,
+                transform["preview_radius"],
+                PREVIEW_COLOR,
+            )
 
             # Update pixel coordinates based on current viewport
             pixel_x = int(norm_x * img_width)
@@ -510,104 +875,84 @@ X-GNOME-UsesNotifications=true
             and self.selected_preview_point_norm
             and self.selected_preview_point_norm[0] >= 0
         ):
-            # Get the center points of both circles
-            mag_norm_x, mag_norm_y = self.selected_magnification_point_norm
-            prev_norm_x, prev_norm_y = self.selected_preview_point_norm
-
-            # Map to display coordinates
-            mag_draw_x = x_offset + (mag_norm_x * image_display_width)
-            mag_draw_y = y_offset + (mag_norm_y * image_display_height)
-            prev_draw_x = x_offset + (prev_norm_x * image_display_width)
-            prev_draw_y = y_offset + (prev_norm_y * image_display_height)
-
-            # Draw the connecting line
-            cr.set_source_rgba(1, 0.5, 0, 0.7)  # Orange, semi-transparent
-            cr.set_line_width(2.0)
-            cr.move_to(mag_draw_x, mag_draw_y)
-            cr.line_to(prev_draw_x, prev_draw_y)
-            cr.stroke()
+            # Draw the connecting line between the circle centers
+            _append_line(
+                snapshot,
+                *mag_draw,
+                *prev_draw,
+                2.0,
+                CONNECTOR_COLOR,
+            )
 
         # If debug mode is enabled, draw the API boundary box only if it's a real API response
-        if self.debug_mode and hasattr(self, "gemini_box") and self.gemini_box:
+        if self.debug_mode and self.gemini_box:
             # Get the original bounding box coordinates from Gemini API
             ox1, oy1, ox2, oy2 = self.gemini_box
 
             # Print debug info to help diagnose coordinate issues
-            print(f"DEBUG: Drawing gemini_box: ({ox1}, {oy1}, {ox2}, {oy2})")
-            print(f"DEBUG: Current image dimensions: {img_width}x{img_height}")
-
-            # Check if we need to adjust coordinates for image resizing
-            if hasattr(self, "original_width") and img_width != self.original_width:
-                # The image might have been resized, adjust coordinates proportionally
-                width_ratio = img_width / self.original_width
-                height_ratio = img_height / self.original_height
-                print(
-                    f"DEBUG: Adjusting coordinates with ratios: {width_ratio}, {height_ratio}"
-                )
+            logger.debug("Drawing gemini_box: (%s, %s, %s, %s)", ox1, oy1, ox2, oy2)
+            logger.debug("Current image dimensions: %sx%s", img_width, img_height)
 
-                # Use ratios to adjust the box coordinates to the current image size
-                ox1 = int(ox1 * width_ratio)
-                oy1 = int(oy1 * height_ratio)
-                ox2 = int(ox2 * width_ratio)
-                oy2 = int(oy2 * height_ratio)
-                print(f"DEBUG: Adjusted gemini_box: ({ox1}, {oy1}, {ox2}, {oy2})")
-
-            # Convert to normalized coordinates
-            norm_ox1 = ox1 / img_width
-            norm_oy1 = oy1 / img_height
-            norm_ox2 = ox2 / img_width
-            norm_oy2 = oy2 / img_height
-            print(
-                f"DEBUG: Normalized gemini_box: ({norm_ox1}, {norm_oy1}, {norm_ox2}, {norm_oy2})"
-            )
+            # The box is in the coordinates of the image Gemini was given,
+            # which may have been resized since; resizing, normalizing and
+            # mapping to the display fold into a single scale per axis
+            box_width = self.original_width or img_width
+            box_height = self.original_height or img_height
+            box_scale_x = image_display_width / box_width
+            box_scale_y = image_display_height / box_height
 
             # Map to display coordinates
-            box_x1 = x_offset + (norm_ox1 * image_display_width)
-            box_y1 = y_offset + (norm_oy1 * image_display_height)
-            box_x2 = x_offset + (norm_ox2 * image_display_width)
-            box_y2 = y_offset + (norm_oy2 * image_display_height)
-            print(
-                f"DEBUG: Display gemini_box: ({box_x1}, {box_y1}, {box_x2}, {box_y2})"
+            box_x1 = x_offset + ox1 * box_scale_x
+            box_y1 = y_offset + oy1 * box_scale_y
+            box_x2 = x_offset + ox2 * box_scale_x
+            box_y2 = y_offset + oy2 * box_scale_y
+            logger.debug(
+                "Display gemini_box: (%s, %s, %s, %s)", box_x1, box_y1, box_x2, box_y2
             )
 
             # Draw the boundary box
-            cr.set_source_rgba(0, 0.5, 1, 0.6)  # Blue, semi-transparent
-            cr.set_line_width(2.0)
-            cr.rectangle(box_x1, box_y1, box_x2 - box_x1, box_y2 - box_y1)
-            cr.stroke()
+            outline = Gsk.RoundedRect()
+            outline.init_from_rect(
+                _rect(box_x1, box_y1, box_x2 - box_x1, box_y2 - box_y1), 0
+            )
+            snapshot.append_border(outline, API_BOX_WIDTHS, API_BOX_COLORS)
 
             # Add a label
-            cr.set_source_rgba(0, 0.5, 1, 0.8)  # Brighter blue for text
-            cr.rectangle(box_x1, box_y1 - 20, 90, 20)
-            cr.fill()
-
-            cr.set_source_rgba(1, 1, 1, 1)  # White text
-            cr.select_font_face("Sans", 0, 0)
-            cr.set_font_size(12)
-            cr.move_to(box_x1 + 5, box_y1 - 5)
-            cr.show_text("API-Grenze")
+            snapshot.append_color(
+                API_LABEL_COLOR,
+                _rect(box_x1, box_y1 - 20, 90, 20),
+            )
+            _append_text(
+                snapshot,
+                widget,
+                "API-Grenze",
+                "Sans 12px",
+                box_x1 + 5,
+                box_y1 - 18,
+                LABEL_TEXT_COLOR,
+            )
         elif self.debug_mode:
             # Draw an error message when we don't have a valid boundary box but debug mode is on
-            cr.select_font_face("Sans", 0, 1)  # 1 = bold
-            cr.set_font_size(16)
-
-            # Draw text shadow
-            cr.set_source_rgba(0, 0, 0, 0.7)
-
-            # Create a semi-transparent background for the text
-            text = "Gemini API failed to provide a valid bounding box"
+            text = GEMINI_BOX_FAILED_MESSAGE
             text_x = width / 2 - 220  # Approximate center
             text_y = 30
 
             # Text background
-            cr.set_source_rgba(0.8, 0, 0, 0.7)  # Red background
-            cr.rectangle(text_x - 5, text_y - 20, 440, 30)
-            cr.fill()
+            snapshot.append_color(
+                ERROR_LABEL_COLOR,
+                _rect(text_x - 5, text_y - 20, 440, 30),
+            )
 
             # Text
-            cr.set_source_rgba(1, 1, 1, 1)  # White text
-            cr.move_to(text_x, text_y)
-            cr.show_text(text)
+            _append_text(
+                snapshot,
+                widget,
+                text,
+                "Sans Bold 16px",
+                text_x,
+                text_y - 17,
+                LABEL_TEXT_COLOR,
+            )
 
     def on_image_click(self, gesture, n_press, x, y):
         """Handle click on the image."""
@@ -618,36 +963,26 @@ X-GNOME-UsesNotifications=true
         if self.current_image:
             img_width, img_height = self.current_image.size
 
-            # Get the widget dimensions
-            widget = gesture.get_widget()
+            # Get the widget dimensions; the gesture is attached to circle_area
+            widget = self.circle_area
             widget_width = widget.get_width()
             widget_height = widget.get_height()
 
-            self.debug_print(f"Widget dimensions: {widget_width}x{widget_height}")
-            self.debug_print(f"Image dimensions: {img_width}x{img_height}")
-            self.debug_print(f"Click at widget coords: ({x}, {y})")
-
-            # Calculate the actual displayed image size (accounting for aspect ratio)
-            display_ratio = img_width / img_height
-            widget_ratio = widget_width / widget_height
-
-            if display_ratio > widget_ratio:
-                # Image is wider than widget - width constrained
-                image_display_width = widget_width
-                image_display_height = widget_width / display_ratio
-            else:
-                # Image is taller than widget - height constrained
-                image_display_height = widget_height
-                image_display_width = widget_height * display_ratio
+            logger.debug("Widget dimensions: %sx%s", widget_width, widget_height)
+            logger.debug("Image dimensions: %sx%s", img_width, img_height)
+            logger.debug("Click at widget coords: (%s, %s)", x, y)
 
-            # Calculate letterboxing/pillarboxing offsets
-            x_offset = (widget_width - image_display_width) / 2
-            y_offset = (widget_height - image_display_height) / 2
+            # Get the actual displayed image size (accounting for aspect ratio)
+            transform = self._get_display_transform(widget_width, widget_height)
+            image_display_width = transform["width"]
+            image_display_height = transform["height"]
+            x_offset = transform["x_offset"]
+            y_offset = transform["y_offset"]
 
-            self.debug_print(
-                f"Display image size: {image_display_width}x{image_display_height}"
+            logger.debug(
+                "Display image size: %sx%s", image_display_width, image_display_height
             )
-            self.debug_print(f"Offsets: {x_offset}, {y_offset}")
+            logger.debug("Offsets: %s, %s", x_offset, y_offset)
 
             # Check if click is within the actual image area
             if (
@@ -671,8 +1006,8 @@ X-GNOME-UsesNotifications=true
             pixel_x = int(norm_x * img_width)
             pixel_y = int(norm_y * img_height)
 
-            self.debug_print(f"Normalized coordinates: ({norm_x:.4f}, {norm_y:.4f})")
-            self.debug_print(f"Pixel coordinates: ({pixel_x}, {pixel_y})")
+            logger.debug("Normalized coordinates: (%.4f, %.4f)", norm_x, norm_y)
+            logger.debug("Pixel coordinates: (%s, %s)", pixel_x, pixel_y)
 
             # Ensure coordinates are within image bounds (redundant check)
             if norm_x < 0 or norm_x > 1 or norm_y < 0 or norm_y > 1:
@@ -688,11 +1023,10 @@ X-GNOME-UsesNotifications=true
                 self.show_notification(
                     f"Vorschaupunkt gesetzt bei ({pixel_x}, {pixel_y})"
                 )
-                self.debug_print(
-                    f"Magnification point selected: {self.selected_magnification_point}"
-                )
-                self.debug_print(
-                    f"Normalized: {self.selected_magnification_point_norm}"
+                logger.debug(
+                    "Magnification point selected: %s (normalized: %s)",
+                    self.selected_magnification_point,
+                    self.selected_magnification_point_norm,
                 )
 
             elif button == 1:  # Left click
@@ -702,28 +1036,38 @@ X-GNOME-UsesNotifications=true
                 self.show_notification(
                     f"Vorschaupunkt gesetzt bei ({pixel_x}, {pixel_y})"
                 )
-                self.debug_print(
-                    f"Preview point selected: {self.selected_preview_point}"
+                logger.debug(
+                    "Preview point selected: %s (normalized: %s)",
+                    self.selected_preview_point,
+                    self.selected_preview_point_norm,
                 )
-                self.debug_print(f"Normalized: {self.selected_preview_point_norm}")
+
+            else:
+                # Other buttons don't move a circle, so there is nothing to redraw
+                return
         else:
             # No image loaded
             self.show_notification("Kein Bild geladen")
             return
 
-        # Redraw the circles
-        widget = gesture.get_widget()
-        widget.queue_draw()
+        # Redraw the circles; GSK only repaints the regions whose render
+        # nodes changed, so this doesn't recomposite the whole overlay
+        self.circle_area.queue_draw()
 
-    def _calculate_selection_box(self):
+    def _calculate_selection_box(self, image=None):
         """Calculate a bounding box for the current magnification point and selection size.
         This is NOT the original API boundary box, but the current selection area.
+
+        Args:
+            image: Image the box is calculated for; defaults to the current image
         """
-        if not self.current_image or not self.selected_magnification_point:
+        if image is None:
+            image = self.current_image
+        if not image or not self.selected_magnification_point:
             return None
 
         # Get image dimensions
-        width, height = self.current_image.size
+        width, height = image.size
         mag_x, mag_y = self.selected_magnification_point
 
         # Calculate the selection circle radius based on image size
@@ -731,26 +1075,13 @@ X-GNOME-UsesNotifications=true
         selection_diameter = int(shortest_dimension * self.selection_ratio)
         radius = selection_diameter / 2  # Use floating point division
 
-        # Calculate the bounding box coordinates - use precise floating point math
-        x1 = max(0, int(mag_x - radius))
-        y1 = max(0, int(mag_y - radius))
-        x2 = min(width, int(mag_x + radius))
-        y2 = min(height, int(mag_y + radius))
-
-        # Ensure the box has the correct dimensions
-        if x2 - x1 < selection_diameter:
-            # Adjust if we hit the edge - use floating point and convert to int
-            if x1 == 0:
-                x2 = min(width, int(x1 + selection_diameter))
-            else:
-                x1 = max(0, int(x2 - selection_diameter))
-
-        if y2 - y1 < selection_diameter:
-            # Adjust if we hit the edge - use floating point and convert to int
-            if y1 == 0:
-                y2 = min(height, int(y1 + selection_diameter))
-            else:
-                y1 = max(0, int(y2 - selection_diameter))
+        # Shift the box inward at the image edges so it always spans the full
+        # selection diameter, then clamp once (the outer max/min only matter
+        # for images smaller than the selection)
+        x1 = max(0, min(int(mag_x - radius), width - selection_diameter))
+        y1 = max(0, min(int(mag_y - radius), height - selection_diameter))
+        x2 = min(width, x1 + selection_diameter)
+        y2 = min(height, y1 + selection_diameter)
 
         return (x1, y1, x2, y2)
 
@@ -764,7 +1095,7 @@ X-GNOME-UsesNotifications=true
 
         # Get the custom prompt from the text view
         custom_prompt = None
-        if hasattr(self, "prompt_entry_view") and self.prompt_entry_view:
+        if self.prompt_entry_view is not None:
             buffer = self.prompt_entry_view.get_buffer()
             start_iter = buffer.get_start_iter()
             end_iter = buffer.get_end_iter()
@@ -774,14 +1105,14 @@ X-GNOME-UsesNotifications=true
             if text.strip() and not self.is_placeholder_visible:
                 custom_prompt = text
             else:
-                print("Using default prompt from user_prompt.md")
+                logger.debug("Using default prompt from user_prompt.md")
 
         # Default target type
         target_type = DEFAULT_TARGET_TYPE
 
-        print(f"Running detection with target type: {target_type}")
+        logger.debug("Running detection with target type: %s", target_type)
         if custom_prompt:
-            print(f"Using custom prompt from entry: {custom_prompt[:50]}...")
+            logger.debug("Using custom prompt from entry: %.50s...", custom_prompt)
 
         # Store the custom prompt for later use
         self.custom_prompt = custom_prompt
@@ -789,68 +1120,98 @@ X-GNOME-UsesNotifications=true
         # Create a thread for the detection to avoid blocking the UI
         detection_thread = threading.Thread(
             target=self._run_detection_thread,
-            args=(self.current_image, target_type),
+            args=(self.current_image, target_type, self.current_image_path),
         )
         detection_thread.daemon = True
         detection_thread.start()
 
-    def _run_detection_thread(self, image, target_type):
-        """Run the detection in a separate thread."""
+    def _run_detection_thread(self, image, target_type, image_path=None):
+        """Run the detection in a separate thread.
+
+        UI updates are collected while the detection runs and handed to the
+        main loop in one idle callback at the end, see _run_ui_updates().
+
+        Args:
+            image: The image to detect the interesting area in
+            target_type: What kind of object to look for
+            image_path: File the image was loaded from; when given, the
+                result is cached by the file's content
+        """
+        ui_updates = []
+        width, height = image.size
         try:
             # Get the custom prompt if it exists
             custom_prompt = None
-            if hasattr(self, "custom_prompt") and self.custom_prompt:
+            if self.custom_prompt:
                 custom_prompt = self.custom_prompt
                 # Replace {target_type} with the actual value
                 custom_prompt = custom_prompt.replace("{target_type}", target_type)
 
-            # Call the gemini detector with the custom prompt
-            interesting_area, raw_box, description = (
-                gemini_analyzer.identify_interesting_textile(
-                    image, custom_prompt, target_type
-                )
-            )
+            # Reuse the answer of an earlier run with the same image and prompt
+            cache_key = None
+            if image_path:
+                try:
+                    cache_key = _gemini_key(
+                        _content_digest(image_path), custom_prompt, target_type
+                    )
+                except OSError as e:
+                    logger.debug("Not caching detection of %s: %s", image_path, e)
+            gemini_result = self._recall(self._gemini_results, cache_key)
+
+            if gemini_result is not None:
+                logger.debug("Using cached Gemini result for %s", image_path)
+            else:
+                # Call the gemini detector with the custom prompt, on a copy
+                # no larger than MAX_GEMINI_EDGE
+                gemini_result = _identify_area(image, custom_prompt, target_type)
+                # Only valid answers are kept, so a failed request is retried
+                if cache_key is not None and gemini_result[1]:
+                    self._remember(self._gemini_results, cache_key, gemini_result)
+            interesting_area, raw_box, description = gemini_result
 
             # Store the raw boundary from Gemini for debug overlay
             # Only store if we got a real response from the API (not a fallback)
             if raw_box:
                 # Store the original raw bounding box to debug inconsistencies
                 self.gemini_box = raw_box
-                # Print additional debug info to help identify coordinate issues
-                x1, y1, x2, y2 = raw_box
-                print(f"DEBUG: Raw gemini_box: ({x1}, {y1}, {x2}, {y2})")
-                print(f"DEBUG: Image dimensions: {image.size[0]}x{image.size[1]}")
-                print("Received valid boundary box from Gemini API")
-                # Clear any previous API failure notification state
-                self._notification_timestamps.pop(
-                    "Gemini API failed to provide a valid bounding box", None
+                # Log additional debug info to help identify coordinate issues
+                logger.debug("Raw gemini_box: %s", raw_box)
+                logger.debug("Image dimensions: %sx%s", width, height)
+                logger.debug("Received valid boundary box from Gemini API")
+                # Clear any previous API failure notification state; the
+                # deadlines belong to the main loop, see show_notification()
+                ui_updates.append(
+                    (self._reset_notification_cooldown, (GEMINI_BOX_FAILED_MESSAGE,))
                 )
             else:
                 # If we didn't get a raw_box, clear any previous box to avoid showing stale data
-                if hasattr(self, "gemini_box"):
-                    print("No valid boundary from Gemini API, clearing debug overlay")
+                if self.gemini_box is not None:
+                    logger.debug(
+                        "No valid boundary from Gemini API, clearing debug overlay"
+                    )
                     self.gemini_box = None
 
                 # Send a notification if debug mode is on - but only once per detection attempt
-                if hasattr(self, "debug_mode") and self.debug_mode:
-                    error_message = "Gemini API failed to provide a valid bounding box"
-                    print(error_message)
-                    # Use idle_add to ensure notification happens in the main thread
-                    GLib.idle_add(
-                        self.show_notification,
-                        error_message,
-                        5,  # Show for 5 seconds
-                        True,  # Use desktop notification
+                if self.debug_mode:
+                    logger.warning(GEMINI_BOX_FAILED_MESSAGE)
+                    ui_updates.append(
+                        (
+                            self.show_notification,
+                            (
+                                GEMINI_BOX_FAILED_MESSAGE,
+                                5,  # Show for 5 seconds
+                                True,  # Use desktop notification
+                            ),
+                        )
                     )
 
             # Update the description in the UI if one was returned
             if description:
-                GLib.idle_add(self._update_description_in_ui, description)
+                ui_updates.append((self._update_description_in_ui, (description,)))
 
             # Update magnification and preview points based on the interesting area
             if interesting_area:
                 x1, y1, x2, y2 = interesting_area
-                width, height = image.size
 
                 # Validate the coordinates to ensure they're within image bounds
                 # and in the correct order (i.e., x1 < x2 and y1 < y2)
@@ -887,41 +1248,66 @@ X-GNOME-UsesNotifications=true
                 norm_preview_y = preview_y / height
                 self.selected_preview_point_norm = (norm_preview_x, norm_preview_y)
 
-                print(f"Gemini API returned boundary box: {interesting_area}")
-                print(f"Set magnification point at: ({mag_x}, {mag_y})")
-                print(f"Normalized magnification: ({norm_mag_x}, {norm_mag_y})")
-                print(f"Set preview point at: ({preview_x}, {preview_y})")
-                print(f"Normalized preview: ({norm_preview_x}, {norm_preview_y})")
+                logger.debug("Gemini API returned boundary box: %s", interesting_area)
+                logger.debug("Set magnification point at: (%s, %s)", mag_x, mag_y)
+                logger.debug(
+                    "Normalized magnification: (%s, %s)", norm_mag_x, norm_mag_y
+                )
+                logger.debug("Set preview point at: (%s, %s)", preview_x, preview_y)
+                logger.debug(
+                    "Normalized preview: (%s, %s)", norm_preview_x, norm_preview_y
+                )
 
                 # Calculate the area percentage for debugging
                 box_width = x2 - x1
                 box_height = y2 - y1
                 area_percentage = (box_width * box_height) / (width * height) * 100
-                self.debug_print(f"Bounding box area: {area_percentage:.2f}% of image")
+                logger.debug("Bounding box area: %.2f%% of image", area_percentage)
 
             # Redraw the circle area
-            GLib.idle_add(lambda: self.circle_area and self.circle_area.queue_draw())
+            ui_updates.append((self._queue_circle_draw, ()))
 
             # Show a more informative notification based on detection success
             if raw_box:
-                GLib.idle_add(
-                    self.show_notification,
-                    "Erkennung abgeschlossen: Interessensbereich erfolgreich identifiziert.",
-                    2,
-                    True,
-                )
+                message = "Erkennung abgeschlossen: Interessensbereich erfolgreich identifiziert."
             else:
-                GLib.idle_add(
-                    self.show_notification,
-                    "Erkennung abgeschlossen: Konnte keinen spezifischen Bereich identifizieren.",
-                    2,
-                    True,
-                )
+                message = "Erkennung abgeschlossen: Konnte keinen spezifischen Bereich identifizieren."
+            ui_updates.append((self.show_notification, (message, 2, True)))
         except Exception as e:
-            print(f"Error in detection thread: {e}")
-            GLib.idle_add(
-                self.show_notification, f"Fehler bei der Erkennung: {e}", 5, True
+            logger.error("Error in detection thread: %s", e)
+            ui_updates.append(
+                (self.show_notification, (f"Fehler bei der Erkennung: {e}", 5, True))
             )
+        finally:
+            GLib.idle_add(self._run_ui_updates, ui_updates)
+
+    def _run_ui_updates(self, ui_updates):
+        """
+        Run UI updates collected by a worker thread, in order (main thread).
+
+        Args:
+            ui_updates: List of (callable, args) tuples
+        """
+        for func, args in ui_updates:
+            func(*args)
+        return False  # Important for GLib.idle_add
+
+    def _reset_notification_cooldown(self, message):
+        """
+        Let a rate-limited message be shown again right away (main thread).
+
+        Only the main loop touches _notification_deadlines, so worker
+        threads hand this over with _post_ui_update() or _run_ui_updates().
+
+        Args:
+            message: The notification message
+        """
+        self._notification_deadlines.pop(message, None)
+
+    def _queue_circle_draw(self):
+        """Redraw the circle overlay, if the manual mode window is open."""
+        if self.circle_area:
+            self.circle_area.queue_draw()
 
     def apply_manual_changes(self, button):
         """Apply changes from manual mode."""
@@ -961,22 +1347,12 @@ X-GNOME-UsesNotifications=true
 
         # Determine if we have a valid gemini_box for debug overlay
         show_debug_overlay = False
-        if self.debug_mode and hasattr(self, "gemini_box") and self.gemini_box:
+        if self.debug_mode and self.gemini_box:
             show_debug_overlay = True
             print("Using Gemini API boundary box in debug overlay")
         elif self.debug_mode:
             print("Debug mode is on but no valid Gemini API boundary box available")
 
-        # Create the processed image for display (with debug overlay if enabled and available)
-        self.processed_image_with_debug = image_processor.create_highlighted_image(
-            self.current_image,
-            interesting_area,
-            preview_center=self.selected_preview_point,
-            selection_ratio=self.selection_ratio,
-            zoom_factor=self.zoom_factor,
-            show_debug_overlay=show_debug_overlay,
-        )
-
         # Create the processed image for saving (never with debug overlay)
         self.processed_image = image_processor.create_highlighted_image(
             self.current_image,
@@ -987,24 +1363,29 @@ X-GNOME-UsesNotifications=true
             show_debug_overlay=False,
         )
 
-        # Update the preview if we have a result
-        if self.processed_image_with_debug and hasattr(self, "output_picture"):
-            # Convert PIL Image to GdkPixbuf
-            # For display, use the version with debug info if available
-            display_image = self.processed_image_with_debug
-            width, height = display_image.size
-
-            # Create an empty pixbuf of the right size
-            pixbuf = GdkPixbuf.Pixbuf.new(
-                GdkPixbuf.Colorspace.RGB, True, 8, width, height
+        # Create the processed image for display; it only differs from the
+        # saved one when the debug overlay is shown
+        if show_debug_overlay:
+            self.processed_image_with_debug = (
+                image_processor.create_highlighted_image(
+                    self.current_image,
+                    interesting_area,
+                    preview_center=self.selected_preview_point,
+                    selection_ratio=self.selection_ratio,
+                    zoom_factor=self.zoom_factor,
+                    show_debug_overlay=True,
+                )
             )
+        else:
+            self.processed_image_with_debug = self.processed_image
 
-            # Convert the PIL image to bytes and load into the pixbuf
-            image_bytes = display_image.tobytes()
-            pixbuf.read_pixel_bytes().append(image_bytes)
-
-            # Set the pixbuf to the picture widget
-            self.output_picture.set_pixbuf(pixbuf)
+        # Update the preview if we have a result
+        if self.processed_image_with_debug and self.output_picture is not None:
+            # For display, use the version with debug info if available; its
+            # pixels are handed to GTK in one copy, whatever the image mode
+            self.output_picture.set_paintable(
+                self._create_texture(self.processed_image_with_debug)
+            )
 
         self.show_notification("Änderungen angewendet")
 
@@ -1013,15 +1394,8 @@ X-GNOME-UsesNotifications=true
         self.show_notification(
             f"Error: {error_message}", 5, True
         )  # Use desktop notification for errors
-        self.processing = False
-
-        # Continue with next image despite error
-        if self.image_queue:
-            self.process_next_image()
-        else:
-            if self.progress_bar:
-                self.progress_bar.set_visible(False)
 
+        # The queue consumer moves on to the next image by itself
         return False  # Important for GLib.idle_add
 
     def _show_ai_installation_instructions(self, container=None):
@@ -1074,10 +1448,7 @@ X-GNOME-UsesNotifications=true
         print(f"Debug checkbox toggled - debug mode set to: {self.debug_mode}")
 
         # Save the debug setting to config
-        try:
-            config.update_config("ui", "debug_mode", self.debug_mode)
-        except Exception as e:
-            print(f"Failed to save debug setting: {e}")
+        self._save_config("ui", "debug_mode", self.debug_mode)
 
         # Just redraw the overlay immediately if we have points set
         if self.circle_area:
@@ -1085,8 +1456,7 @@ X-GNOME-UsesNotifications=true
 
         # Reprocess the image with new setting if we have a magnification point set
         if (
-            hasattr(self, "selected_magnification_point")
-            and self.selected_magnification_point
+            self.selected_magnification_point
             and self.selected_magnification_point[0] >= 0
             and self.selected_magnification_point[1] >= 0
         ):
@@ -1095,12 +1465,10 @@ X-GNOME-UsesNotifications=true
     def on_selection_size_changed(self, scale):
         """Handle changes to the selection size slider."""
         self.selection_ratio = scale.get_value()
-        self.debug_print(f"Selection size ratio set to: {self.selection_ratio}")
+        self.debug_print("Selection size ratio set to: %s", self.selection_ratio)
 
-        # Save the setting to config
-        config.update_config(
-            "image_processing", "selection_ratio", self.selection_ratio
-        )
+        # Save the setting to config once the slider stops moving
+        self._schedule_slider_save()
 
         # Update the display immediately
         if self.circle_area:
@@ -1109,15 +1477,57 @@ X-GNOME-UsesNotifications=true
     def on_zoom_factor_changed(self, scale):
         """Handle changes to the zoom factor slider."""
         self.zoom_factor = scale.get_value()
-        self.debug_print(f"Zoom factor set to: {self.zoom_factor}")
+        self.debug_print("Zoom factor set to: %s", self.zoom_factor)
 
-        # Save the setting to config
-        config.update_config("image_processing", "zoom_factor", self.zoom_factor)
+        # Save the setting to config once the slider stops moving
+        self._schedule_slider_save()
 
         # Update the display immediately
         if self.circle_area:
             self.circle_area.queue_draw()
 
+    def _schedule_slider_save(self):
+        """
+        Save the slider settings after SLIDER_SAVE_DELAY ms without changes.
+
+        A drag fires the value-changed handlers many times a second; each
+        new value replaces the pending save, so the config file is written
+        once per gesture instead of once per step.
+        """
+        if self._slider_save_id:
+            GLib.source_remove(self._slider_save_id)
+        self._slider_save_id = GLib.timeout_add(
+            SLIDER_SAVE_DELAY, self._save_slider_settings
+        )
+
+    def _save_slider_settings(self):
+        """Write the current selection size and zoom factor to the config."""
+        self._slider_save_id = 0
+        self._save_config("image_processing", "selection_ratio", self.selection_ratio)
+        self._save_config("image_processing", "zoom_factor", self.zoom_factor)
+        return False  # Important for GLib.timeout_add
+
+    def _save_config(self, section, key, value):
+        """
+        Save a setting to the config file on the config writer thread.
+
+        Writing the file can block on slow or network storage, so it is kept
+        off the main loop; settings are written in the order they are saved.
+
+        Args:
+            section: Config section, e.g. "ui"
+            key: Setting name within the section
+            value: Value to store
+        """
+        self._config_writer.submit(self._write_config, section, key, value)
+
+    def _write_config(self, section, key, value):
+        """Write one setting to the config file (config writer thread)."""
+        try:
+            config.update_config(section, key, value)
+        except Exception as e:
+            logger.warning("Failed to save %s.%s to config: %s", section, key, e)
+
     def reset_prompt_to_default(self, button):
         """Reset the prompt to the default template."""
         try:
@@ -1125,7 +1535,7 @@ X-GNOME-UsesNotifications=true
             with open(DEFAULT_PROMPT_FILE, "w", encoding="utf-8") as f:
                 f.write(config.DEFAULT_USER_PROMPT)
 
-            if hasattr(self, "prompt_entry_view") and self.prompt_entry_view:
+            if self.prompt_entry_view is not None:
                 self.prompt_entry_view.get_buffer().set_text(config.DEFAULT_USER_PROMPT)
             self.show_notification("Benutzeraufforderung auf Standard zurückgesetzt")
         except Exception as e:
@@ -1133,7 +1543,7 @@ X-GNOME-UsesNotifications=true
 
     def save_prompt_as_default(self, button):
         """Save the current prompt as the default one."""
-        if hasattr(self, "prompt_entry_view") and self.prompt_entry_view:
+        if self.prompt_entry_view is not None:
             buffer = self.prompt_entry_view.get_buffer()
             start_iter = buffer.get_start_iter()
             end_iter = buffer.get_end_iter()
@@ -1150,7 +1560,7 @@ X-GNOME-UsesNotifications=true
 
     def _update_description_in_ui(self, description):
         """Update the description label in the UI (called from the main thread)."""
-        if hasattr(self, "description_label") and self.description_label:
+        if self.description_label is not None:
             # Make the description more noticeable by adding a prefix
             if description:
                 # Trim excessively long descriptions
@@ -1165,8 +1575,7 @@ X-GNOME-UsesNotifications=true
                 print(f"Updated UI with description: {description}")
 
                 # Highlight using a notification too
-                if hasattr(self, "show_notification"):
-                    self.show_notification("Beschreibung von Gemini KI erhalten", 2)
+                self.show_notification("Beschreibung von Gemini KI erhalten", 2)
             else:
                 self.description_label.set_text("No description available from AI")
         return False  # For GLib.idle_add
@@ -1308,47 +1717,183 @@ X-GNOME-UsesNotifications=true
             self.show_notification("Prompt is empty, not saving")
 
     def process_image(self, image_path):
-        """Start processing the image in a separate thread."""
-        # Mark that we're processing
+        """Process a single dropped image on one worker thread.
+
+        A single file needs no producer thread, bounded queue or progress
+        reporting, so this skips the batch machinery entirely.
+        """
+        # Supersede any batch that is still running; its consumer no longer
+        # calls _image_queue_finished(), so its state is reset here
+        batch_id = self._start_batch()
+        self.image_queue = None
+        self.processing = False
+        if self.progress_bar:
+            self.progress_bar.set_visible(False)
+        self._queued_count = 1
+
+        self._image_pool.submit(self._process_image_thread, image_path, batch_id)
+
+    def _start_batch(self):
+        """Reset the progress state for a new drop.
+
+        Returns:
+            int: The new batch id, to be passed to _process_image_thread()
+        """
+        self._batch_id += 1
+        self._queued_count = 0
+        self._processed_count = 0
+        self._progress_percent = -1
+        return self._batch_id
+
+    def _start_image_queue(self, image_paths):
+        """Start a producer/consumer pair that feeds images through a bounded queue.
+
+        Args:
+            image_paths: Iterable of image paths; it is consumed on the producer
+                thread, so a lazy directory walk never blocks the UI.
+        """
+        batch_id = self._start_batch()
+        image_queue = queue.Queue(maxsize=IMAGE_QUEUE_SIZE)
+        self.image_queue = image_queue
         self.processing = True
-        self.show_notification(f"Processing {os.path.basename(image_path)}...")
 
-        # Load the image in a background thread
-        thread = threading.Thread(target=self._process_image_thread, args=(image_path,))
-        thread.daemon = True
-        thread.start()
+        producer = threading.Thread(
+            target=self._produce_image_paths, args=(image_paths, image_queue)
+        )
+        producer.daemon = True
+        producer.start()
+
+        consumer = threading.Thread(
+            target=self._consume_image_paths, args=(image_queue, batch_id)
+        )
+        consumer.daemon = True
+        consumer.start()
 
-    def _process_image_thread(self, image_path):
-        """Process an image in a background thread."""
+    def _produce_image_paths(self, image_paths, image_queue):
+        """Push image paths into the queue, followed by a None sentinel."""
         try:
-            GLib.idle_add(
-                self.show_notification,
-                f"Processing {os.path.basename(image_path)}...",
-                2,
+            for image_path in image_paths:
+                # Stop scanning if a newer drop has replaced this queue
+                if self.image_queue is not image_queue:
+                    break
+                self._queued_count += 1
+                image_queue.put(image_path)  # Blocks while the queue is full
+        except OSError as e:
+            GLib.idle_add(self._show_error, str(e))
+        finally:
+            image_queue.put(None)
+
+    def _consume_image_paths(self, image_queue, batch_id):
+        """Hand queued images to the worker pool until the sentinel arrives.
+
+        At most IMAGE_WORKERS images are in flight at once, so one image's
+        Gemini round-trip overlaps the others' decoding and rendering while
+        only a bounded number of decoded images is held in memory.
+        """
+        in_flight = set()
+        while (image_path := image_queue.get()) is not None:
+            # A superseded queue is still drained so its producer can finish
+            if self.image_queue is not image_queue:
+                continue
+
+            if len(in_flight) >= IMAGE_WORKERS:
+                _, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+            in_flight.add(
+                self._image_pool.submit(
+                    self._process_image_thread, image_path, batch_id
+                )
             )
 
-            # Store the current image path
-            self.current_image_path = image_path
-            self.current_dir = os.path.dirname(image_path)
+        concurrent.futures.wait(in_flight)
+        if self.image_queue is image_queue:
+            GLib.idle_add(self._image_queue_finished)
+
+    def _image_queue_finished(self):
+        """Called on the main thread once every queued image has been handled."""
+        self.processing = False
+        if self.progress_bar:
+            self.progress_bar.set_visible(False)
+
+        if not self._queued_count:
+            self.show_notification("Keine Bilder im Verzeichnis gefunden")
+        else:
+            # Don't include file path here since it's a summary notification
+            self.show_notification("Alle Bilder verarbeitet", 3, True)
+        return False  # Important for GLib.idle_add
 
-            # Open the image with PIL
-            self.current_image = Image.open(image_path)
-            print(f"Processing image: {image_path}")
-            print(f"Current directory: {self.current_dir}")
+    def _process_image_thread(self, image_path, batch_id):
+        """
+        Process an image on a worker pool thread.
 
-            width, height = self.current_image.size
-            print(f"Image dimensions: {width}x{height}")
+        Several images may be processed at once, so the image state is kept
+        local to the job; only the finished result is handed to the UI.
 
-            # Keep RGBA mode when possible - only convert to RGB when sending to Gemini API
-            # We'll use a copy for the Gemini API to avoid modifying the original
+        Args:
+            image_path: Path of the image to process
+            batch_id: Id of the drop the image belongs to, see _start_batch()
+        """
+        image = None
+        gemini_request = None
+        try:
+            file_name = os.path.basename(image_path)
+            self._post_ui_update(notification=(f"Processing {file_name}...", 2))
+
+            current_dir = os.path.dirname(image_path)
+            data = _read_image_file(image_path)
+
+            # Skip files whose identical content was already processed with
+            # the same settings, e.g. the same photo dropped from two folders
+            digest = _content_digest(image_path, data)
+            job_key = self._job_key(digest)
+            previous_output = self._recall(self._processed_outputs, job_key)
+            if previous_output and os.path.exists(previous_output):
+                logger.debug(
+                    "Skipping %s, identical to %s", image_path, previous_output
+                )
+                self._post_ui_update(
+                    notification=(
+                        f"Already processed: {os.path.basename(previous_output)}",
+                        2,
+                    ),
+                    completed=1,
+                    batch_id=batch_id,
+                )
+                return
 
             # Check if we have manually selected points
-            if (
-                hasattr(self, "selected_magnification_point")
-                and self.selected_magnification_point
+            use_manual_points = bool(
+                self.selected_magnification_point
                 and self.selected_magnification_point[0] >= 0
                 and self.selected_magnification_point[1] >= 0
+            )
+
+            # For JPEGs, start the Gemini request on a reduced decode right
+            # away, so the full-size decode below overlaps the network call
+            gemini_key = _gemini_key(digest)
+            gemini_result = self._recall(self._gemini_results, gemini_key)
+            if (
+                not use_manual_points
+                and gemini_result is None
+                and data is not None
+                and data.startswith(b"\xff\xd8\xff")
             ):
+                gemini_request = self._gemini_pool.submit(
+                    _identify_area_from_jpeg, image_path, data
+                )
+
+            image = _decode_image(image_path, data)
+            logger.debug("Processing image: %s", image_path)
+            logger.debug("Current directory: %s", current_dir)
+
+            width, height = image.size
+            logger.debug("Image dimensions: %dx%d", width, height)
+
+            # Keep RGBA mode when possible - only convert to RGB when sending to Gemini API
+            # We'll use a copy for the Gemini API to avoid modifying the original
+
+            if use_manual_points:
                 # Use manually selected points
                 mag_x, mag_y = self.selected_magnification_point
                 preview_x, preview_y = (
@@ -1357,50 +1902,25 @@ X-GNOME-UsesNotifications=true
                     else (mag_x + 128, mag_y + 128)
                 )
 
-                print(f"Magnification point: ({mag_x}, {mag_y})")
-                print(f"Preview point: ({preview_x}, {preview_y})")
-
-                # Calculate the selection box based on current point and settings
-                interesting_area = self._calculate_selection_box()
+                logger.debug("Magnification point: (%s, %s)", mag_x, mag_y)
+                logger.debug("Preview point: (%s, %s)", preview_x, preview_y)
 
-                # Calculate radius regardless of whether interesting_area exists
-                shortest_dimension = min(width, height)
-                selection_diameter = int(shortest_dimension * self.selection_ratio)
-                radius = selection_diameter / 2
+                # Calculate the selection box based on current point and settings;
+                # it is shifted inward at the edges, so it always keeps the full
+                # selection size when the image is large enough
+                interesting_area = self._calculate_selection_box(image)
+                area_is_valid = True
 
-                # If calculation failed, fallback to something reasonable
-                if not interesting_area:
-                    # Use the radius calculated above
-                    x1 = max(0, mag_x - radius)
-                    y1 = max(0, mag_y - radius)
-                    x2 = min(width, mag_x + radius)
-                    y2 = min(height, mag_y + radius)
-                    interesting_area = (x1, y1, x2, y2)
-
-                print(f"Using manually selected area: {interesting_area}")
+                logger.debug("Using manually selected area: %s", interesting_area)
 
                 # For the debug overlay, we'll use the actual Gemini box if available
                 # or the calculated box if not
-                debug_box = (
-                    self.gemini_box if hasattr(self, "gemini_box") else interesting_area
-                )
+                debug_box = self.gemini_box or interesting_area
 
                 # Create a processed image with the highlight, passing the configurable parameters
-                # For display, we may want to show debug overlay
-                self.processed_image_with_debug = (
-                    image_processor.create_highlighted_image(
-                        self.current_image,
-                        interesting_area,
-                        preview_center=(preview_x, preview_y),
-                        selection_ratio=self.selection_ratio,
-                        zoom_factor=self.zoom_factor,
-                        show_debug_overlay=self.debug_mode and debug_box is not None,
-                    )
-                )
-
                 # For saving, we never want the debug overlay
-                self.processed_image = image_processor.create_highlighted_image(
-                    self.current_image,
+                processed_image = image_processor.create_highlighted_image(
+                    image,
                     interesting_area,
                     preview_center=(preview_x, preview_y),
                     selection_ratio=self.selection_ratio,
@@ -1408,28 +1928,44 @@ X-GNOME-UsesNotifications=true
                     show_debug_overlay=False,  # Never show debug overlay in saved image
                 )
 
+                # For display, we may want to show debug overlay; without it the
+                # display image is identical, so reuse it instead of rendering twice
+                if self.debug_mode and debug_box is not None:
+                    display_image = image_processor.create_highlighted_image(
+                        image,
+                        interesting_area,
+                        preview_center=(preview_x, preview_y),
+                        selection_ratio=self.selection_ratio,
+                        zoom_factor=self.zoom_factor,
+                        show_debug_overlay=True,
+                    )
+                else:
+                    display_image = processed_image
+
             else:
                 # Use Gemini API to identify interesting textile parts
-                print("No valid manual selection, using Gemini API")
-
-                # For Gemini API, we need to make a copy that might need RGB conversion
-                gemini_image = self.current_image
-                if gemini_image.mode == "RGBA":
-                    # Only convert the copy to RGB for the API
-                    gemini_image = gemini_image.copy().convert("RGB")
-
-                interesting_area, raw_box, description = (
-                    gemini_analyzer.identify_interesting_textile(gemini_image)
+                logger.debug("No valid manual selection, using Gemini API")
+
+                # Only the API copy is scaled and converted; the output keeps
+                # its full resolution and alpha
+                start = time.perf_counter()
+                if gemini_result is not None:
+                    logger.debug("Using cached Gemini result for %s", image_path)
+                elif gemini_request is not None:
+                    gemini_result = gemini_request.result()
+                else:
+                    gemini_result = _identify_area(image)
+                interesting_area, raw_box, description = gemini_result
+                # Without a box, interesting_area is only a fallback guess
+                area_is_valid = bool(raw_box)
+                logger.debug(
+                    "Waited %.1f ms for Gemini after decoding",
+                    (time.perf_counter() - start) * 1000,
                 )
 
-                # Store the original Gemini API boundary box for debug overlay
-                self.gemini_box = interesting_area
-
-                # Store the raw boundary box
-                self.raw_gemini_box = raw_box
-
-                # Store the description
-                self.gemini_description = description
+                # Only valid answers are kept, so a failed request is retried
+                if raw_box:
+                    self._remember(self._gemini_results, gemini_key, gemini_result)
 
                 # Update the description in the UI if we're in a manual mode window
                 # (needs to be done in the main thread)
@@ -1437,184 +1973,305 @@ X-GNOME-UsesNotifications=true
                     GLib.idle_add(self._update_description_in_ui, description)
 
                 if raw_box:
-                    print(f"Raw Gemini box before adjustments: {self.raw_gemini_box}")
-                    # Clear any previous API failure notification state
-                    self._notification_timestamps.pop(
-                        "Gemini API failed to provide a valid bounding box", None
+                    logger.debug(
+                        "Raw Gemini box before adjustments: %s", raw_box
                     )
+                    # Clear any previous API failure notification state
+                    self._post_ui_update(reset_cooldown=GEMINI_BOX_FAILED_MESSAGE)
                 else:
                     # Send a notification if debug mode is on and we didn't get a valid bounding box
-                    if hasattr(self, "debug_mode") and self.debug_mode:
-                        error_message = (
-                            "Gemini API failed to provide a valid bounding box"
-                        )
-                        print(error_message)
-                        # Use idle_add to ensure notification happens in the main thread
-                        GLib.idle_add(
-                            self.show_notification,
-                            error_message,
-                            5,  # Show for 5 seconds
-                            True,  # Use desktop notification
+                    if self.debug_mode:
+                        logger.warning(GEMINI_BOX_FAILED_MESSAGE)
+                        self._post_ui_update(
+                            notification=(
+                                GEMINI_BOX_FAILED_MESSAGE,
+                                5,  # Show for 5 seconds
+                                True,  # Use desktop notification
+                            )
                         )
 
                 if description:
-                    print(f"Gemini description: {description}")
+                    logger.debug("Gemini description: %s", description)
 
                 # Determine if we have a valid gemini_box for debug overlay
                 show_debug_overlay = False
                 if self.debug_mode and raw_box:
                     show_debug_overlay = True
-                    print("Using Gemini API boundary box in debug overlay")
+                    logger.debug("Using Gemini API boundary box in debug overlay")
                 elif self.debug_mode:
-                    print(
+                    logger.debug(
                         "Debug mode is on but no valid Gemini API boundary box available"
                     )
 
                 # Create a processed image with the highlight - use original image to preserve quality
-                # For display, we may want to show debug overlay
-                self.processed_image_with_debug = (
-                    image_processor.create_highlighted_image(
-                        self.current_image,
-                        interesting_area,
-                        selection_ratio=self.selection_ratio,
-                        zoom_factor=self.zoom_factor,
-                        show_debug_overlay=show_debug_overlay,
-                    )
-                )
-
                 # For saving, we never want the debug overlay
-                self.processed_image = image_processor.create_highlighted_image(
-                    self.current_image,
+                processed_image = image_processor.create_highlighted_image(
+                    image,
                     interesting_area,
                     selection_ratio=self.selection_ratio,
                     zoom_factor=self.zoom_factor,
                     show_debug_overlay=False,  # Never show debug overlay in saved image
                 )
 
-            # Show notification about AI status
-            if not gemini_analyzer.AI_ENABLED:
-                # Remove desktop notification but keep console logging
-                print(
-                    "Using fallback mode (no Gemini AI). Install google-generativeai package for AI features."
-                )
-                # Comment out or remove the notification
-                # GLib.idle_add(
-                #     self.show_notification,
-                #     "Using fallback mode (no Gemini AI). Install google-generativeai package for AI features.",
-                #     5,
-                # )
+                # For display, we may want to show debug overlay; without it the
+                # display image is identical, so reuse it instead of rendering twice
+                if show_debug_overlay:
+                    display_image = image_processor.create_highlighted_image(
+                        image,
+                        interesting_area,
+                        selection_ratio=self.selection_ratio,
+                        zoom_factor=self.zoom_factor,
+                        show_debug_overlay=True,
+                    )
+                else:
+                    display_image = processed_image
 
             # Save debug image with red dot at the interesting spot
             debug_path = image_processor.save_debug_image(
-                self.current_image,
+                image,
                 interesting_area,
                 image_path,
                 debug_dir=DEBUG_DIR,
-                current_dir=self.current_dir,
+                current_dir=current_dir,
             )
-            print(f"Debug image saved to: {debug_path}")
+            logger.debug("Debug image saved to: %s", debug_path)
 
             # Save the processed image
             output_path = image_processor.save_processed_image(
-                self.processed_image,  # Use the clean version without debug overlay for saving
+                processed_image,  # Use the clean version without debug overlay for saving
                 image_path,
                 output_dir=PREVIEWS_DIR,
-                current_dir=self.current_dir,
+                current_dir=current_dir,
             )
-            print(f"Processed image saved to: {output_path}")
+            logger.debug("Processed image saved to: %s", output_path)
+            # A fallback area is not remembered, so the image is retried
+            if output_path and area_is_valid:
+                self._remember(self._processed_outputs, job_key, output_path)
 
             # Show completion notification with desktop notification and file path for opening
             if output_path:  # Add a check to ensure output_path is not None
                 filename = os.path.basename(output_path)
-                GLib.idle_add(
-                    self.show_notification,
+                notification = (
                     f"Image processing complete: {filename}",
                     3,
                     True,  # Use desktop notification for completion
                     output_path,  # Pass the file path for opening
                 )
             else:
-                GLib.idle_add(
-                    self.show_notification,
+                notification = (
                     "Image processing complete",
                     3,
                     True,  # Use desktop notification for completion
                 )
 
-            # Update the UI on the main thread
-            GLib.idle_add(self._processing_complete)
+            # Update the UI on the main thread; for display, use the version
+            # with debug info if available. The pending update holds the only
+            # remaining reference, so the image is freed once it has been shown.
+            self._post_ui_update(
+                notification=notification,
+                display_image=display_image or processed_image,
+                completed=1,
+                batch_id=batch_id,
+            )
 
         except Exception as e:
-            GLib.idle_add(self._show_error, str(e))
+            # A failed image still counts towards the batch's progress
+            self._post_ui_update(error=str(e), completed=1, batch_id=batch_id)
+        finally:
+            # Release the decoded image as soon as the job is done, so a long
+            # batch only keeps IMAGE_WORKERS of them resident at a time
+            if image is not None:
+                image.close()
+            # Don't send a request for an image that failed to decode
+            if gemini_request is not None:
+                gemini_request.cancel()
+
+    def _job_key(self, digest):
+        """
+        Identify a processing job by file content and the settings it uses.
 
-    def _processing_complete(self):
-        """Called when processing is complete to update the UI."""
-        # Enable any disabled buttons
-        if hasattr(self, "buttons"):
-            for button in self.buttons:
-                button.set_sensitive(True)
+        Args:
+            digest: Digest of the image file from _content_digest()
 
-        # Update the preview if we have a result
-        if self.processed_image and hasattr(self, "output_picture"):
-            # For display, use the version with debug info if available
-            display_image = (
-                self.processed_image_with_debug
-                if hasattr(self, "processed_image_with_debug")
-                and self.processed_image_with_debug
-                else self.processed_image
-            )
-            width, height = display_image.size
+        Returns:
+            tuple: Content digest, the detection prompt in effect and the
+                settings that affect the output
+        """
+        return (
+            digest,
+            _read_default_prompt(),
+            self.selection_ratio,
+            self.zoom_factor,
+            self.selected_magnification_point,
+            self.selected_preview_point,
+        )
 
-            # Create an empty pixbuf of the right size
-            pixbuf = GdkPixbuf.Pixbuf.new(
-                GdkPixbuf.Colorspace.RGB, True, 8, width, height
-            )
+    def _recall(self, results, key):
+        """
+        Look up a remembered result, marking it as recently used.
 
-            # Convert the PIL image to bytes
-            image_bytes = display_image.tobytes()
-            pixbuf.read_pixel_bytes().append(image_bytes)
+        Args:
+            results: self._processed_outputs or self._gemini_results
+            key: Key of the result
 
-            # Set the pixbuf to the picture widget
-            self.output_picture.set_pixbuf(pixbuf)
+        Returns:
+            The result, or None if it isn't remembered
+        """
+        with self._results_lock:
+            value = results.get(key)
+            if value is not None:
+                results.move_to_end(key)
+            return value
 
-        # Reset processing state
-        self.processing = False
+    def _remember(self, results, key, value):
+        """
+        Remember a result, dropping the least recently used one if needed.
 
-        # Update progress notification
-        if self.image_queue:
-            total = len(self.image_queue) + 1  # +1 for the current image
-            progress = 1 - (len(self.image_queue) / total)
-            percent = int(progress * 100)
-            self.show_notification(f"Verarbeite {percent}% der Bilder")
+        Args:
+            results: self._processed_outputs or self._gemini_results
+            key: Key of the result
+            value: The result
+        """
+        with self._results_lock:
+            results[key] = value
+            results.move_to_end(key)
+            if len(results) > RESULT_HISTORY:
+                results.popitem(last=False)
 
-            # Process the next image
-            self.process_next_image()
-        else:
-            # Don't include file path here since it's a summary notification
-            self.show_notification("Alle Bilder verarbeitet", 3, True)
+    def _post_ui_update(
+        self,
+        notification=None,
+        display_image=None,
+        completed=0,
+        error=None,
+        batch_id=None,
+        reset_cooldown=None,
+    ):
+        """
+        Hand UI state from a worker thread to the main loop.
+
+        Updates posted before the main loop gets around to them are merged
+        into a single idle callback: finished counts and errors add up, and
+        only the latest notification and preview image are shown. A burst of
+        failing images therefore costs one callback and one error message,
+        not one per image.
+
+        Args:
+            notification: Positional arguments for show_notification(), if any
+            display_image: The processed image to show in the preview, if any
+            completed: Number of images finished since the last update
+            error: Message for _show_error(), if any; it is shown after the
+                notification, so later progress messages don't hide it
+            batch_id: Batch the finished image belongs to; the preview image
+                and completed count of a superseded batch are dropped
+            reset_cooldown: Message whose notification cooldown should end,
+                see _reset_notification_cooldown()
+        """
+        with self._ui_lock:
+            if reset_cooldown is not None:
+                self._pending_ui.setdefault("reset_cooldown", set()).add(
+                    reset_cooldown
+                )
+            if notification is not None:
+                self._pending_ui["notification"] = notification
+            if error is not None:
+                self._pending_ui["error"] = error
+                self._pending_ui["errors"] = self._pending_ui.get("errors", 0) + 1
+            if batch_id == self._batch_id:
+                # Completions still pending from a superseded batch are stale
+                if self._pending_ui.get("batch_id") != batch_id:
+                    self._pending_ui.pop("completed", None)
+                    self._pending_ui.pop("display_image", None)
+                    self._pending_ui["batch_id"] = batch_id
+                if display_image is not None:
+                    self._pending_ui["display_image"] = display_image
+                if completed:
+                    self._pending_ui["completed"] = (
+                        self._pending_ui.get("completed", 0) + completed
+                    )
+
+            if self._idle_update_pending:
+                return
+            self._idle_update_pending = True
+
+        GLib.idle_add(self._flush_ui_state)
+
+    def _flush_ui_state(self):
+        """Apply the UI state merged by _post_ui_update() (main thread)."""
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+            self._idle_update_pending = False
+
+        for message in pending.get("reset_cooldown", ()):
+            self._reset_notification_cooldown(message)
+        if "notification" in pending:
+            self.show_notification(*pending["notification"])
+        # A drop made since these were posted supersedes them
+        if "completed" in pending and pending["batch_id"] == self._batch_id:
+            self._processing_complete(
+                pending.get("display_image"), pending["completed"]
+            )
+        if "error" in pending:
+            if pending["errors"] > 1:
+                self._show_error(
+                    f"{pending['errors']} images failed (last: {pending['error']})"
+                )
+            else:
+                self._show_error(pending["error"])
+        return False  # Important for GLib.idle_add
+
+    def _processing_complete(self, display_image=None, completed=1):
+        """Called when processing is complete to update the UI.
+
+        Args:
+            display_image: The processed image to show in the preview, if any
+            completed: Number of images finished since the last call
+        """
+        # Enable any disabled buttons
+        for button in self.buttons:
+            button.set_sensitive(True)
+
+        # Update the preview if we have a result
+        if display_image and self.output_picture is not None:
+            self.output_picture.set_paintable(self._create_texture(display_image))
+
+        # Update progress notification; the total grows while the scan runs
+        self._processed_count += completed
+        total = self._queued_count
+        if self._processed_count < total:
+            # Large batches finish many images per percent; only announce
+            # the percentage when it changes
+            percent = int(self._processed_count / total * 100)
+            if percent != self._progress_percent:
+                self._progress_percent = percent
+                self.show_notification(f"Verarbeite {percent}% der Bilder")
+            if self.progress_bar:
+                self.progress_bar.set_fraction(self._processed_count / total)
 
         if self.spinner:
             self.spinner.stop()
         return False  # Important for GLib.idle_add
 
-    def process_next_image(self):
-        """Process the next image in the queue."""
-        if not self.image_queue:
-            self.show_notification(
-                "Alle Bilder verarbeitet", 3, True
-            )  # Use desktop notification for completion
-            return
-
-        # Get the next image path
-        image_path = self.image_queue.pop(0)
-        self.current_image_path = image_path
-        self.process_image(image_path)
+    def _iter_directory_images(self, directory):
+        """Yield image files below a directory (runs on the producer thread).
 
-        # Show progress through notifications instead of progress bar
-        total = len(self.image_queue) + 1  # +1 for the current image
-        progress = 1 - (len(self.image_queue) / total)
-        percent = int(progress * 100)
-        self.show_notification(f"Verarbeite {percent}% der Bilder")
+        os.scandir() takes the entry types from the directory listing, so
+        unlike os.walk() no extra stat() call is needed per entry.
+        """
+        pending = [directory]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError as e:
+                # Skip unreadable directories, like os.walk() does
+                logger.debug("Skipping directory: %s", e)
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif _is_image_file(entry.name):
+                        yield entry.path
 
     def process_dropped_file(self, file):
         """Process a dropped file or directory."""
@@ -1629,44 +2286,23 @@ X-GNOME-UsesNotifications=true
         else:
             self.current_dir = os.path.dirname(file_path)
 
-        # Clear any existing image queue
-        self.image_queue = []
-
         # Check if it's a directory or a file
         if os.path.isdir(file_path):
-            # Directory dropped, look for image files
-            image_extensions = [".jpg", ".jpeg", ".png", ".bmp", ".gif"]
-
-            for root, _, files in os.walk(file_path):
-                for file_name in files:
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext in image_extensions:
-                        self.image_queue.append(os.path.join(root, file_name))
-
-            if not self.image_queue:
-                self.show_notification("Keine Bilder im Verzeichnis gefunden")
-                return False
-
-            # Start processing the first image
-            count = len(self.image_queue)
-            self.show_notification(f"Verarbeite {count} Bilder...")
+            # Directory dropped: images are processed while the scan is running,
+            # replacing any queue left over from a previous drop
+            self.show_notification("Verarbeite Bilder...")
 
             # Setup progress bar
             if self.progress_bar:
                 self.progress_bar.set_visible(True)
                 self.progress_bar.set_fraction(0)
 
-            self.process_next_image()
+            self._start_image_queue(self._iter_directory_images(file_path))
             return True
 
         # Single file dropped, check if it's an image
-        ext = os.path.splitext(file_path)[1].lower()
-        image_extensions = [".jpg", ".jpeg", ".png", ".bmp", ".gif"]
-
-        if ext in image_extensions:
-            self.image_queue.append(file_path)
-            self.show_notification("Processing image...")
-            self.process_next_image()
+        if _is_image_file(file_path):
+            self.process_image(file_path)
             return True
 
         self.show_notification("Die Datei ist kein Bild")
@@ -1680,6 +2316,17 @@ X-GNOME-UsesNotifications=true
 
     def do_shutdown(self):
         """Clean up resources when the application is shutting down."""
+        # Let running jobs finish, but drop images that haven't started
+        self._image_pool.shutdown(wait=False, cancel_futures=True)
+        self._gemini_pool.shutdown(wait=False, cancel_futures=True)
+
+        # Don't lose a slider change that hasn't been saved yet, and wait
+        # for the pending config writes to reach the file
+        if self._slider_save_id:
+            GLib.source_remove(self._slider_save_id)
+            self._save_slider_settings()
+        self._config_writer.shutdown(wait=True)
+
         # Uninitialize libnotify
         if Notify.is_initted():
             Notify.uninit()
@@ -1707,7 +2354,7 @@ X-GNOME-UsesNotifications=true
                 self, f"is_placeholder_visible_{view_id}", False
             )
         else:
-            is_placeholder_visible = getattr(self, "is_placeholder_visible", False)
+            is_placeholder_visible = self.is_placeholder_visible
 
         # When focused, clear the placeholder text
         if is_placeholder_visible:
@@ -1753,7 +2400,7 @@ X-GNOME-UsesNotifications=true
                 )
                 setattr(self, f"is_placeholder_visible_{view_id}", True)
             else:
-                placeholder_text = getattr(self, "placeholder_text", "[Standard]")
+                placeholder_text = self.placeholder_text
                 self.is_placeholder_visible = True
 
             buffer.set_text(placeholder_text)
@@ -1788,7 +2435,7 @@ X-GNOME-UsesNotifications=true
                 self, f"is_placeholder_visible_{view_id}", False
             )
         else:
-            is_placeholder_visible = getattr(self, "is_placeholder_visible", False)
+            is_placeholder_visible = self.is_placeholder_visible
 
         if is_placeholder_visible:
             buffer = text_view.get_buffer()
@@ -1814,50 +2461,105 @@ X-GNOME-UsesNotifications=true
             y: Y-coordinate of the click
         """
         # This method is primarily used to dismiss focus from other widgets
-        if hasattr(self, "window"):
+        if self.window is not None:
             self.window.grab_focus()
 
+    def _make_drop_area(self, icon_name, label, handler):
+        """
+        Build a drop area with a centered icon and label.
+
+        Args:
+            icon_name: Name of the themed icon to show
+            label: Text shown below the icon
+            handler: Connected to the drop target's "drop" signal
+
+        Returns:
+            Gtk.Box: The drop area
+        """
+        drop_area = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        drop_area.set_size_request(150, 150)
+        drop_area.set_hexpand(True)
+        drop_area.set_vexpand(True)
+        drop_area.set_halign(Gtk.Align.CENTER)
+        drop_area.set_valign(Gtk.Align.CENTER)
+
+        # Center the icon in the drop area
+        icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        icon_box.set_halign(Gtk.Align.CENTER)
+        icon_box.set_valign(Gtk.Align.CENTER)
+        icon_box.set_vexpand(True)
+
+        icon = Gtk.Image.new_from_icon_name(icon_name)
+        icon.set_pixel_size(48)  # Larger icon
+        mode_label = Gtk.Label(label=label)
+        mode_label.set_margin_top(10)
+        mode_label.add_css_class("mode-label")
+
+        icon_box.append(icon)
+        icon_box.append(mode_label)
+        drop_area.append(icon_box)
+
+        # Set up drag and drop functionality
+        drop_target = Gtk.DropTarget.new(Gio.File, Gdk.DragAction.COPY)
+        drop_target.connect("drop", handler)
+        drop_area.add_controller(drop_target)
+
+        return drop_area
+
     def _setup_css_providers(self):
         """Set up all CSS providers for the application.
 
-        This centralizes all CSS styling in one place.
+        This centralizes all CSS styling in one place. The stylesheet is
+        parsed and registered with the display only once, however often
+        the application is activated.
         """
-        # Create the main CSS provider
-        main_css_provider = Gtk.CssProvider()
-        main_css_provider.load_from_data(
-            b"""
-            .heading {
-                font-size: 20px;
-                font-weight: bold;
-            }
-            .description-text {
-                font-size: 16px;
-                line-height: 1.5;
-            }
-            .prompt-text {
-                font-size: 18px;
-                line-height: 1.5;
-            }
-            textview.placeholder {
-                color: alpha(#666666, 0.7);
-                font-style: italic;
-                font-size: 95%;
-            }
-            .desc-text {
-                font-size: 14px;
-                line-height: 1.3;
-            }
-            """,
-            -1,  # Length parameter, -1 means auto-detect length
-        )
+        cls = type(self)
+        if cls._css_provider is None:
+            cls._css_provider = Gtk.CssProvider()
+            cls._css_provider.load_from_data(
+                b"""
+                box {
+                    background-color: #333333;
+                    border-radius: 8px;
+                }
+                .mode-label {
+                    color: white;
+                    font-weight: bold;
+                }
+                .heading {
+                    font-size: 20px;
+                    font-weight: bold;
+                }
+                .description-text {
+                    font-size: 16px;
+                    line-height: 1.5;
+                }
+                .prompt-text {
+                    font-size: 18px;
+                    line-height: 1.5;
+                }
+                textview.placeholder {
+                    color: alpha(#666666, 0.7);
+                    font-style: italic;
+                    font-size: 95%;
+                }
+                .desc-text {
+                    font-size: 14px;
+                    line-height: 1.3;
+                }
+                """,
+                -1,  # Length parameter, -1 means auto-detect length
+            )
 
         # Apply the CSS provider to the display
         display = Gdk.Display.get_default()
-        Gtk.StyleContext.add_provider_for_display(
-            display, main_css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        if cls._css_display is not display:
+            Gtk.StyleContext.add_provider_for_display(
+                display, cls._css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            cls._css_display = display
 
-        return main_css_provider
+        return cls._css_provider
 
     def on_auto_drop(self, drop_target, value, x, y):
         """Handle automatic mode drop."""
@@ -1898,53 +2600,149 @@ X-GNOME-UsesNotifications=true
         Returns:
             True if notification was shown, False otherwise
         """
-        # Rate limiting based on message content
-        current_time = time.time()
-        cooldown_period = 1  # Default 1 second cooldown between identical notifications
-
-        # For the Gemini API failure message, use a longer cooldown
-        if "Gemini API failed to provide a valid bounding box" in message:
-            cooldown_period = 10  # 10 seconds between Gemini API failure notifications
-
-        # For detection completion messages, use longer cooldown
-        if "Erkennung abgeschlossen" in message:
-            cooldown_period = 5  # 5 seconds between detection completion notifications
+        # Rate limiting based on message content; the monotonic clock
+        # doesn't jump when the system time is changed
+        current_time = time.monotonic()
 
-        # Check if we've shown this message recently
-        if message in self._notification_timestamps:
-            last_time = self._notification_timestamps[message]
-            if current_time - last_time < cooldown_period:
-                return False  # Skip this notification, it's too soon
-
-        # Update timestamp for this message
-        self._notification_timestamps[message] = current_time
+        # Skip this notification if it's too soon after the same message
+        deadline = self._notification_deadlines.get(message)
+        if deadline is not None and current_time < deadline:
+            return False
 
-        # Now show the notification
-        error_prefix = "ERROR: " if is_error else ""
-        print(f"Notification: {error_prefix}{message}")
+        # Remember when the message may be shown again, forgetting the
+        # oldest one; some messages have a longer cooldown than the default
+        cooldown = next(
+            (
+                seconds
+                for text, seconds in NOTIFICATION_COOLDOWNS
+                if text in message
+            ),
+            NOTIFICATION_COOLDOWN,
+        )
+        self._notification_deadlines[message] = current_time + cooldown
+        self._notification_deadlines.move_to_end(message)
+        if len(self._notification_deadlines) > NOTIFICATION_HISTORY:
+            self._notification_deadlines.popitem(last=False)
+
+        # Now show the notification; a batch posts several per image, so
+        # they are only echoed to the console when logging asks for them
+        if is_error:
+            logger.error("Notification: %s", message)
+        else:
+            logger.info("Notification: %s", message)
 
         # Update the status bar if we have one
         self._update_status_bar(message)
 
+        # Clear the message after the timeout; a newer message replaces the
+        # pending clear instead of stacking another timer
+        if self._notification_timer_id:
+            GLib.source_remove(self._notification_timer_id)
+        self._notification_timer_id = GLib.timeout_add_seconds(
+            timeout, self._clear_status_bar
+        )
+
         return True
 
     def _update_status_bar(self, message):
         """Update the status bar with a message."""
-        if hasattr(self, "status_bar") and self.status_bar:
+        if self.status_bar is not None:
             self.status_bar.set_text(message)
         return False
 
     def _clear_status_bar(self):
         """Clear the status bar message."""
-        if hasattr(self, "status_bar") and self.status_bar:
+        self._notification_timer_id = 0
+        if self.status_bar is not None:
             self.status_bar.set_text("")
         return False
 
     def open_manual_mode_window(self, file_path):
-        """Open a window for manual mode editing."""
-        # Load the image
+        """Open a window for manual mode editing.
+
+        The image is decoded on a worker thread so the drop does not block
+        the GTK main loop; the window is built once decoding has finished.
+        """
+        threading.Thread(
+            target=self._load_manual_image,
+            args=(file_path, self._get_preview_bounds()),
+            daemon=True,
+        ).start()
+
+    def _load_manual_image(self, file_path, max_size):
+        """
+        Decode an image for manual mode in a background thread.
+
+        Args:
+            file_path: Path to the image to open
+            max_size: (width, height) bound for the display-sized copy
+        """
+        try:
+            image = _decode_image(file_path)
+
+            # Scale the display copy down from the decoded pixels instead of
+            # reading and decoding the file a second time. resize() writes
+            # straight into the small image, where thumbnail() would need a
+            # full-size copy first; an image that already fits is shared.
+            scale = min(max_size[0] / image.width, max_size[1] / image.height)
+            if scale < 1:
+                preview_image = image.resize(
+                    (
+                        max(1, round(image.width * scale)),
+                        max(1, round(image.height * scale)),
+                    ),
+                    Image.BILINEAR,
+                    reducing_gap=2.0,
+                )
+            else:
+                preview_image = image
+        except Exception as e:
+            logger.warning("Error opening image %s: %s", file_path, e)
+            GLib.idle_add(
+                self.show_notification,
+                f"Error opening image: {e}",
+                3,
+                False,
+                None,
+                True,
+            )
+            return
+
+        GLib.idle_add(self._build_manual_window, file_path, image, preview_image)
+
+    def _get_preview_bounds(self):
+        """
+        Get the largest size an image is displayed at in manual mode.
+
+        Returns:
+            tuple: (max_width, max_height) - 80% of the screen size
+        """
+        display = Gdk.Display.get_default()
+        monitor = display.get_monitors().get_item(0)
+        if monitor:
+            geometry = monitor.get_geometry()
+            screen_width = geometry.width
+            screen_height = geometry.height
+        else:
+            # Fallback values if we can't get screen dimensions
+            screen_width = 1920
+            screen_height = 1080
+
+        return int(screen_width * 0.8), int(screen_height * 0.8)
+
+    def _build_manual_window(self, file_path, image, preview_image):
+        """
+        Build and show the manual mode window for an already decoded image.
+
+        Args:
+            file_path: Path to the image file
+            image: The decoded full-resolution PIL image
+            preview_image: The decoded display-sized PIL image
+
+        Returns:
+            bool: False to remove the idle callback
+        """
         try:
-            image = Image.open(file_path)
             self.current_image = image
             self.current_image_path = file_path
 
@@ -1979,7 +2777,7 @@ X-GNOME-UsesNotifications=true
             try:
                 # Create the image section with overlay
                 overlay, circle_area = self._create_image_section(
-                    image_container, image, manual_window
+                    image_container, image, manual_window, preview_image
                 )
 
                 # Create all controls sections
@@ -2013,15 +2811,16 @@ X-GNOME-UsesNotifications=true
             print(f"Error opening image: {e}")
             self.show_notification(f"Error opening image: {e}", is_error=True)
 
+        return False
+
     def _run_initial_detection(self, button):
         """Run the initial detection once after window setup and then remove the timer."""
         # Run the detection
-        if button and hasattr(self, "rerun_detection"):
+        if button:
             self.rerun_detection(button)
 
         # Remove the timer so it doesn't run again
-        if hasattr(self, "_auto_detection_timer"):
-            self._auto_detection_timer = None
+        self._auto_detection_timer = None
 
         # Return False to ensure the timeout doesn't repeat
         return False
@@ -2078,7 +2877,35 @@ X-GNOME-UsesNotifications=true
 
         return image_container, controls_box
 
-    def _create_image_section(self, image_container, image, manual_window):
+    def _create_texture(self, image):
+        """
+        Create a texture from a PIL image for display in a picture widget.
+
+        Args:
+            image: The PIL image to upload (converted to RGB/RGBA if needed)
+
+        Returns:
+            Gdk.Texture: A texture holding the image pixels
+        """
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        # Hand the raw buffer straight to GTK; going through a GdkPixbuf
+        # would cost another full-image copy before the texture upload
+        has_alpha = image.mode == "RGBA"
+        width, height = image.size
+        return Gdk.MemoryTexture.new(
+            width,
+            height,
+            Gdk.MemoryFormat.R8G8B8A8 if has_alpha else Gdk.MemoryFormat.R8G8B8,
+            GLib.Bytes.new(image.tobytes()),
+            width * (4 if has_alpha else 3),
+        )
+
+    def _create_image_section(
+        self, image_container, image, manual_window, preview_image
+    ):
         """
         Create the image display section with overlay for circle drawing.
 
@@ -2086,6 +2913,7 @@ X-GNOME-UsesNotifications=true
             image_container: The container to add the image section to
             image: The PIL image to display
             manual_window: The parent window
+            preview_image: Display-sized copy of the image, closed once uploaded
 
         Returns:
             tuple: (overlay, circle_area) - References to key UI components
@@ -2093,21 +2921,8 @@ X-GNOME-UsesNotifications=true
         # Get image dimensions
         img_width, img_height = image.size
 
-        # Get screen dimensions
-        display = Gdk.Display.get_default()
-        monitor = display.get_monitors().get_item(0)
-        if monitor:
-            geometry = monitor.get_geometry()
-            screen_width = geometry.width
-            screen_height = geometry.height
-        else:
-            # Fallback values if we can't get screen dimensions
-            screen_width = 1920
-            screen_height = 1080
-
         # Calculate appropriate window size (80% of screen size maximum)
-        max_width = int(screen_width * 0.8)
-        max_height = int(screen_height * 0.8)
+        max_width, max_height = self._get_preview_bounds()
 
         # Determine if we need to scale the image
         scale_factor = 1.0
@@ -2122,9 +2937,11 @@ X-GNOME-UsesNotifications=true
         picture.set_content_fit(Gtk.ContentFit.CONTAIN)  # Preserve aspect ratio
         picture.set_can_shrink(True)  # Allow image to shrink when window resizes
 
-        # Load the image
-        pixbuf = GdkPixbuf.Pixbuf.new_from_file(self.current_image_path)
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        # Show the display-sized copy made by _load_manual_image(); once
+        # uploaded it is no longer needed, unless it is the image itself
+        texture = self._create_texture(preview_image)
+        if preview_image is not image:
+            preview_image.close()
         picture.set_paintable(texture)
 
         # Make the picture expand to fill available space
@@ -2145,23 +2962,20 @@ X-GNOME-UsesNotifications=true
         self.display_scale = scale_factor
 
         self.debug_print(
-            f"Display size: {img_width}x{img_height}, Scale: {scale_factor}"
+            "Display size: %sx%s, Scale: %s", img_width, img_height, scale_factor
         )
 
         # Create an overlay to draw circles on the image
         overlay = Gtk.Overlay()
         overlay.set_child(picture)
 
-        # Create a drawing area for circles
-        circle_area = Gtk.DrawingArea()
+        # Create a widget that draws the circles as render nodes
+        circle_area = CircleOverlay(self.on_draw_circles)
 
-        # Make the drawing area fill the entire overlay
+        # Make the circle widget fill the entire overlay
         circle_area.set_hexpand(True)
         circle_area.set_vexpand(True)
 
-        # Set the drawing function
-        circle_area.set_draw_func(self.on_draw_circles)
-
         # Store a reference to the circle_area for redrawing
         self.circle_area = circle_area
 
@@ -2511,6 +3325,24 @@ X-GNOME-UsesNotifications=true
 
 def main():
     """Run the application."""
+    # Console log level, e.g. PREVIEW_MAKER_LOG=DEBUG for per-image details
+    level = os.environ.get("PREVIEW_MAKER_LOG", "WARNING").upper()
+    # getLevelName() maps known level names to their number
+    valid_level = isinstance(logging.getLevelName(level), int)
+    logging.basicConfig(
+        level=level if valid_level else "WARNING",
+        format="%(levelname)s: %(message)s",
+    )
+    if not valid_level:
+        logger.warning("Unknown log level PREVIEW_MAKER_LOG=%s, using WARNING", level)
+    _log_pillow_backend()
+    # AI availability can't change while running, so report it once here
+    # rather than for every processed image
+    if not gemini_analyzer.AI_ENABLED:
+        logger.info(
+            "Using fallback mode (no Gemini AI). "
+            "Install google-generativeai package for AI features."
+        )
     app = PreviewMaker()
     return app.run(sys.argv)
 
@@ -6,7 +6,8 @@ regions in images and generate appropriate previews.
 """
 
 from preview_maker.ai.analyzer import ImageAnalyzer
+from preview_maker.ai.cache import AnalysisCache
 from preview_maker.ai.parser import ResponseParser
 from preview_maker.ai.integration import AIPreviewGenerator
 
-__all__ = ["ImageAnalyzer", "ResponseParser", "AIPreviewGenerator"]
+__all__ = ["ImageAnalyzer", "AnalysisCache", "ResponseParser", "AIPreviewGenerator"]
@@ -13,8 +13,12 @@ import google.generativeai as genai
 from PIL import Image
 
 from preview_maker.core.logging import logger
+from preview_maker.ai.cache import AnalysisCache
 from preview_maker.ai.parser import ResponseParser
 
+# Maximum number of images sent to the API in a single batch request
+MAX_BATCH_SIZE = 16
+
 
 class ImageAnalyzer:
     """Analyzes images using the Google Gemini API.
@@ -27,6 +31,7 @@ class ImageAnalyzer:
         _model_name: The name of the Gemini model to use
         parser: The ResponseParser for parsing API responses
         _client: The Gemini API client for generating content
+        _cache: Optional cache of results, keyed by the image file or pixels
     """
 
     def __init__(
@@ -34,6 +39,7 @@ class ImageAnalyzer:
         api_key: Optional[str] = None,
         model_name: str = "gemini-1.5-pro-vision",
         client: Any = None,
+        cache: Optional[AnalysisCache] = None,
     ) -> None:
         """Initialize the ImageAnalyzer.
 
@@ -41,10 +47,13 @@ class ImageAnalyzer:
             api_key: The Google Gemini API key. If None, tries to get from env var.
             model_name: The name of the Gemini model to use
             client: Optional client instance for testing
+            cache: Optional AnalysisCache; when given, images that were
+                analyzed before are answered without an API request
         """
         self._model_name = model_name
         self.parser = ResponseParser()
         self._client = client
+        self._cache = cache
 
         # If no client provided, set up real API client
         if self._client is None:
@@ -61,16 +70,42 @@ class ImageAnalyzer:
 
         logger.info(f"ImageAnalyzer initialized with model: {model_name}")
 
-    def analyze_image(self, image: Image.Image) -> Optional[List[Dict[str, Any]]]:
+    def analyze_image(
+        self, image: Image.Image, image_path: Optional[Union[str, Path]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
         """Analyze an image to find interesting regions.
 
         Args:
             image: The PIL Image to analyze
+            image_path: File the image was loaded from, if any; the cache
+                then identifies the image by its file, see
+                AnalysisCache.make_key()
 
         Returns:
             A list of dictionaries containing coordinates and metadata for
             interesting regions in the image, or None if an error occurs
         """
+        cache_key = self._cache_key(image, image_path)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached analysis result")
+                return cached
+
+        return self._request_analysis(image, cache_key)
+
+    def _request_analysis(
+        self, image: Image.Image, cache_key: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Send a single image to the API, without looking at the cache.
+
+        Args:
+            image: The PIL Image to analyze
+            cache_key: Key to cache the highlights under, if caching is enabled
+
+        Returns:
+            The highlights, or None if an error occurs
+        """
         try:
             # Prepare the image for the API
             image_bytes = self._prepare_image(image)
@@ -83,22 +118,87 @@ class ImageAnalyzer:
                 [prompt, {"mime_type": "image/jpeg", "data": image_bytes}]
             )
 
-            # Parse the response
-            highlights = self.parser.parse_response(response.text)
-
-            if not highlights:
-                logger.warning("No highlights found in API response")
-                return None
-
-            # Log the results
-            logger.info(f"Analysis found {len(highlights)} interesting regions")
-
-            return highlights
+            return self._parse_highlights(response.text, cache_key)
 
         except Exception as e:
             logger.error(f"Error analyzing image: {e}")
             return None
 
+    def analyze_images(
+        self,
+        images: List[Image.Image],
+        image_paths: Optional[List[Optional[Union[str, Path]]]] = None,
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Analyze several images with as few API requests as possible.
+
+        Up to MAX_BATCH_SIZE images are sent in each request, which saves a
+        network round-trip and the prompt overhead per image when a whole
+        folder is processed. Images with a cached result are not sent.
+
+        Args:
+            images: The PIL Images to analyze
+            image_paths: Files the images were loaded from, one per image,
+                as for analyze_image()
+
+        Returns:
+            One entry per image, in order: a list of dictionaries like those
+            returned by analyze_image(), or None if no regions were found
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(images)
+        if image_paths is None:
+            image_paths = [None] * len(images)
+        cache_keys = [
+            self._cache_key(image, image_path)
+            for image, image_path in zip(images, image_paths)
+        ]
+
+        # Indices of the images that still need an API request
+        pending = []
+        for index, cache_key in enumerate(cache_keys):
+            cached = self._cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        for start in range(0, len(pending), MAX_BATCH_SIZE):
+            indices = pending[start : start + MAX_BATCH_SIZE]
+            batch = [images[index] for index in indices]
+
+            # A lone image gets the regular, more detailed prompt; its cache
+            # lookup already missed above
+            if len(batch) == 1:
+                results[indices[0]] = self._request_analysis(
+                    batch[0], cache_keys[indices[0]]
+                )
+                continue
+
+            try:
+                contents: List[Any] = [self._build_batch_prompt(len(batch))]
+                for image in batch:
+                    contents.append(
+                        {"mime_type": "image/jpeg", "data": self._prepare_image(image)}
+                    )
+
+                response = self._client.generate_content(contents)
+                batch_results = self.parser.parse_batch_response(
+                    response.text, len(batch)
+                )
+
+            except Exception as e:
+                logger.error(f"Error analyzing image batch: {e}")
+                batch_results = [None] * len(batch)
+
+            for index, highlights in zip(indices, batch_results):
+                results[index] = highlights
+                if highlights is not None and cache_keys[index] is not None:
+                    self._cache.put(cache_keys[index], highlights)
+
+        found = sum(result is not None for result in results)
+        logger.info(f"Batch analysis found regions in {found} of {len(images)} images")
+
+        return results
+
     def analyze_image_from_path(
         self, path: Union[str, Path]
     ) -> Optional[List[Dict[str, Any]]]:
@@ -141,7 +241,7 @@ class ImageAnalyzer:
                 return self.parser.parse_response(mock_response.text)
 
             # For real images, proceed with normal analysis
-            result = self.analyze_image(image)
+            result = self.analyze_image(image, path)
 
             # Close the image to free resources
             image.close()
@@ -181,6 +281,54 @@ class ImageAnalyzer:
 
         return pixel_highlights
 
+    def _cache_key(
+        self, image: Image.Image, image_path: Optional[Union[str, Path]] = None
+    ) -> Optional[str]:
+        """Get the cache key for an image.
+
+        Args:
+            image: The PIL Image to analyze
+            image_path: File the image was loaded from, if any
+
+        Returns:
+            The cache key, or None if caching is disabled or the image
+            can't be hashed
+        """
+        if self._cache is None:
+            return None
+
+        try:
+            return self._cache.make_key(image, self._model_name, image_path)
+        except Exception as e:
+            logger.warning(f"Failed to hash image for the analysis cache: {e}")
+            return None
+
+    def _parse_highlights(
+        self, response_text: str, cache_key: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Parse the highlights from a single-image API response.
+
+        Args:
+            response_text: The text of the API response
+            cache_key: Key to cache the highlights under, if caching is enabled
+
+        Returns:
+            The parsed highlights, or None if none were found
+        """
+        highlights = self.parser.parse_response(response_text)
+
+        if not highlights:
+            logger.warning("No highlights found in API response")
+            return None
+
+        # Log the results
+        logger.info(f"Analysis found {len(highlights)} interesting regions")
+
+        if cache_key is not None:
+            self._cache.put(cache_key, highlights)
+
+        return highlights
+
     def _prepare_image(self, image: Image.Image) -> bytes:
         """Prepare an image for the Gemini API.
 
@@ -235,3 +383,43 @@ class ImageAnalyzer:
         Provide coordinates as normalized values between 0 and 1.
         Limit your response to the 3 most interesting regions.
         """
+
+    def _build_batch_prompt(self, count: int) -> str:
+        """Build a prompt for analyzing several images in one request.
+
+        Args:
+            count: The number of images attached to the request
+
+        Returns:
+            The prompt text
+        """
+        return f"""
+        Analyze each of the {count} attached images and highlight areas of interest.
+        The images are numbered 1 to {count} in the order they are attached.
+
+        For each interesting region, provide:
+        1. The X and Y coordinates of the center of the region (as values between 0 and 1)
+        2. A suggested radius for a circular highlight (as a value between 0 and 1)
+        3. A brief description of what makes this region interesting
+
+        Format your response in JSON format like this, with one entry per image:
+        {{
+          "images": [
+            {{
+              "image": 1,
+              "highlights": [
+                {{
+                  "x": 0.5,
+                  "y": 0.5,
+                  "radius": 0.2,
+                  "description": "Center of the image showing a mountain peak"
+                }}
+              ]
+            }}
+          ]
+        }}
+
+        Provide coordinates as normalized values between 0 and 1, relative to
+        each image's own dimensions.
+        Limit your response to the 3 most interesting regions per image.
+        """
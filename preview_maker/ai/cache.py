@@ -0,0 +1,148 @@
+"""Caching of Gemini analysis results for Preview Maker.
+
+This module contains the AnalysisCache class, which stores the highlights
+returned by the Gemini API keyed by the analyzed image file's identity (its
+path, size and modification time), so re-running an analysis on the same,
+unchanged file doesn't need a network request. Images without a file are
+keyed by their pixel data.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from PIL import Image
+
+from preview_maker.core.logging import logger
+
+# Default location of the cached results
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "preview_maker"
+    / "analysis"
+)
+
+# Bump whenever the prompts or the parsing change, so results produced by
+# an older version are no longer returned from the cache
+PROMPT_VERSION = "v1"
+
+
+class AnalysisCache:
+    """Caches analysis results in memory and on disk.
+
+    Recently used results are kept in an in-memory LRU; every result is
+    also written as a small JSON file, so it survives a restart.
+
+    Attributes:
+        _cache_dir: Directory holding the JSON files
+        _max_entries: Maximum number of results kept in memory
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 128,
+    ) -> None:
+        """Initialize the AnalysisCache.
+
+        Args:
+            cache_dir: Directory for the JSON files. Defaults to
+                DEFAULT_CACHE_DIR.
+            max_entries: Maximum number of results kept in memory
+        """
+        self._cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        image: Image.Image,
+        model_name: str,
+        image_path: Optional[Union[str, Path]] = None,
+    ) -> str:
+        """Build the cache key for an image.
+
+        Hashing the pixel data copies the whole image, so callers that know
+        the file an image was loaded from should pass it; the file's path,
+        size and modification time then identify the image instead.
+
+        Args:
+            image: The PIL Image to be analyzed
+            model_name: The name of the Gemini model doing the analysis
+            image_path: File the image was loaded from, if any
+
+        Returns:
+            A hex digest of the model and either the file's identity or the
+            image mode, size and pixel data, followed by the prompt version
+
+        Raises:
+            OSError: If image_path can't be accessed
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if image_path is not None:
+            stat = os.stat(image_path)
+            path = os.path.abspath(image_path)
+            digest.update(
+                f"{model_name}:{path}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+        else:
+            digest.update(f"{model_name}:{image.mode}:{image.size}".encode())
+            digest.update(image.tobytes())
+        return f"{digest.hexdigest()}-{PROMPT_VERSION}"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached highlights for a key.
+
+        Args:
+            key: A key returned by make_key()
+
+        Returns:
+            A copy of the cached highlights, or None if there are none
+        """
+        with self._lock:
+            highlights = self._entries.get(key)
+            if highlights is not None:
+                self._entries.move_to_end(key)
+                return [dict(highlight) for highlight in highlights]
+
+        try:
+            with open(self._cache_dir / f"{key}.json", encoding="utf-8") as f:
+                highlights = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read cached analysis {key}: {e}")
+            return None
+
+        self._remember(key, highlights)
+        return [dict(highlight) for highlight in highlights]
+
+    def put(self, key: str, highlights: List[Dict[str, Any]]) -> None:
+        """Cache the highlights for a key.
+
+        Args:
+            key: A key returned by make_key()
+            highlights: The highlights returned by the analysis
+        """
+        highlights = [dict(highlight) for highlight in highlights]
+        self._remember(key, highlights)
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_dir / f"{key}.json", "w", encoding="utf-8") as f:
+                json.dump(highlights, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write cached analysis {key}: {e}")
+
+    def _remember(self, key: str, highlights: List[Dict[str, Any]]) -> None:
+        """Store highlights in the in-memory LRU, evicting the oldest entry."""
+        with self._lock:
+            self._entries[key] = highlights
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -5,13 +5,14 @@ with the Google Gemini API to generate image previews with highlights.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from PIL import Image
 
 from preview_maker.core.logging import logger
 from preview_maker.image.processor import ImageProcessor
-from preview_maker.ai.analyzer import ImageAnalyzer
+from preview_maker.ai.analyzer import ImageAnalyzer, MAX_BATCH_SIZE
+from preview_maker.ai.cache import AnalysisCache
 
 
 class AIPreviewGenerator:
@@ -27,14 +28,26 @@ class AIPreviewGenerator:
         processor: The ImageProcessor instance
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model_name: Optional[str] = None,
+        cache: Optional[AnalysisCache] = None,
+    ) -> None:
         """Initialize the AIPreviewGenerator.
 
         Args:
             api_key: The Google Gemini API key
+            model_name: The Gemini model to use; defaults to the
+                ImageAnalyzer default
+            cache: Optional AnalysisCache for the analysis results; without
+                one, every image is sent to the API
         """
         self.api_key = api_key
-        self.analyzer = ImageAnalyzer(api_key=api_key)
+        analyzer_args: Dict[str, Any] = {"api_key": api_key, "cache": cache}
+        if model_name:
+            analyzer_args["model_name"] = model_name
+        self.analyzer = ImageAnalyzer(**analyzer_args)
         self.processor = (
             ImageProcessor()
         )  # Using processor instead of image_processor to match tests
@@ -93,7 +106,7 @@ class AIPreviewGenerator:
             return None
 
         # Analyze the image to find interesting regions
-        highlights = self.analyzer.analyze_image(image)
+        highlights = self.analyzer.analyze_image(image, image_path)
         if not highlights:
             logger.warning(f"No highlights found in image: {image_path}")
             return None
@@ -110,11 +123,151 @@ class AIPreviewGenerator:
 
         # Save the result if output path is provided
         if output_path:
-            result_image.save(output_path)
+            self._save_preview(result_image, output_path)
             logger.info(f"Saved preview to {output_path}")
 
         return result_image
 
+    def generate_previews(
+        self,
+        image_paths: List[Union[str, Path]],
+        output_paths: Optional[List[Optional[Union[str, Path]]]] = None,
+    ) -> List[Optional[Image.Image]]:
+        """Generate previews for several images with batched analysis.
+
+        The images are analyzed with ImageAnalyzer.analyze_images(), which
+        sends up to MAX_BATCH_SIZE images per API request instead of making
+        one request per image. Every preview is kept in memory until all
+        images are done; use save_previews() for large folders.
+
+        Args:
+            image_paths: Paths to the image files
+            output_paths: Optional paths to save the previews, one per image
+
+        Returns:
+            One entry per image: the processed image with highlights, or None
+            if processing failed
+        """
+        return list(self._iter_previews(image_paths, output_paths))
+
+    def save_previews(
+        self,
+        image_paths: List[Union[str, Path]],
+        output_paths: List[Union[str, Path]],
+    ) -> List[bool]:
+        """Generate and save previews without keeping them in memory.
+
+        Works like generate_previews(), but each preview is released once it
+        has been saved, so only one batch of source images is resident at a
+        time however many images there are.
+
+        Args:
+            image_paths: Paths to the image files
+            output_paths: Paths to save the previews, one per image
+
+        Returns:
+            One entry per image: True if its preview was saved
+        """
+        return [
+            preview is not None
+            for preview in self._iter_previews(image_paths, output_paths)
+        ]
+
+    def _iter_previews(
+        self,
+        image_paths: List[Union[str, Path]],
+        output_paths: Optional[List[Optional[Union[str, Path]]]] = None,
+    ) -> Iterator[Optional[Image.Image]]:
+        """Yield the preview of each image, analyzing them in batches.
+
+        Args:
+            image_paths: Paths to the image files
+            output_paths: Optional paths to save the previews, one per image
+
+        Yields:
+            One entry per image, in order: the processed image with
+            highlights, or None if processing failed
+        """
+        if output_paths is None:
+            output_paths = [None] * len(image_paths)
+
+        # Only one batch of images is held in memory at a time
+        for start in range(0, len(image_paths), MAX_BATCH_SIZE):
+            batch_paths = image_paths[start : start + MAX_BATCH_SIZE]
+            batch_outputs = output_paths[start : start + MAX_BATCH_SIZE]
+
+            images: List[Optional[Image.Image]] = []
+            for image_path in batch_paths:
+                image = None
+                try:
+                    if Path(image_path).exists():
+                        # Without a callback, load_image() returns the image
+                        image = self.processor.load_image(str(image_path))
+                except Exception as e:
+                    logger.error(f"Error loading image {image_path}: {e}")
+                if image is None:
+                    logger.error(f"Failed to load image: {image_path}")
+                images.append(image)
+
+            loaded = [im for im in images if im is not None]
+            loaded_paths = [
+                path for path, im in zip(batch_paths, images) if im is not None
+            ]
+            try:
+                analyses = iter(self.analyzer.analyze_images(loaded, loaded_paths))
+            except Exception as e:
+                logger.error(f"Error analyzing batch of {len(loaded)} images: {e}")
+                analyses = iter([None] * len(loaded))
+
+            for image_path, output_path, image in zip(
+                batch_paths, batch_outputs, images
+            ):
+                if image is None:
+                    yield None
+                    continue
+
+                highlights = next(analyses)
+                if not highlights:
+                    logger.warning(f"No highlights found in image: {image_path}")
+                    yield None
+                    continue
+
+                # A failing image must not abort the rest of the batch
+                try:
+                    pixel_highlights = self.analyzer.convert_highlights_to_pixels(
+                        highlights, image.size
+                    )
+                    result_image = self._create_preview_with_overlays(
+                        image, pixel_highlights
+                    )
+
+                    if output_path:
+                        self._save_preview(result_image, output_path)
+                        logger.info(f"Saved preview to {output_path}")
+                except Exception as e:
+                    logger.error(f"Failed to generate preview for {image_path}: {e}")
+                    yield None
+                    continue
+
+                yield result_image
+
+            # The previews are copies, so the sources can go with the batch
+            for image in images:
+                if image is not None:
+                    image.close()
+
+    @staticmethod
+    def _save_preview(image: Image.Image, output_path: Union[str, Path]) -> None:
+        """Save a preview, dropping the alpha channel for JPEG output.
+
+        Args:
+            image: The preview image, usually in RGBA mode
+            output_path: Path to save the preview to
+        """
+        if Path(output_path).suffix.lower() in (".jpg", ".jpeg"):
+            image = image.convert("RGB")
+        image.save(output_path)
+
     def _load_image_sync(self, image_path: Union[str, Path]) -> Optional[Image.Image]:
         """Load an image synchronously.
 
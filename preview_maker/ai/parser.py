@@ -77,6 +77,72 @@ class ResponseParser:
         logger.debug(f"Parsed {len(highlights)} highlights from response")
         return highlights
 
+    def parse_batch_response(
+        self, response: Union[str, Dict[str, Any]], count: int
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Split a response covering several images into per-image highlights.
+
+        The response is expected to contain a JSON object of the form
+        {"images": [{"image": 1, "highlights": [...]}, ...]}, where the
+        image numbers are 1-based and follow the order of the request.
+
+        Args:
+            response: The response from the Gemini API, either as a string or
+                    a dict with a 'raw_response' key
+            count: The number of images sent in the request
+
+        Returns:
+            One entry per image, in request order: a list of highlights, or
+            None if the response has no valid highlights for that image
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * count
+
+        if isinstance(response, dict):
+            response = response.get("raw_response", "")
+        if not response:
+            logger.warning("Empty response received")
+            return results
+
+        # Take the outermost JSON object, ignoring any surrounding prose
+        start = response.find("{")
+        end = response.rfind("}")
+        if start == -1 or end < start:
+            logger.warning("No JSON object found in batch response")
+            return results
+
+        try:
+            data = json.loads(response[start : end + 1])
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse JSON from batch response: {e}")
+            return results
+
+        entries = data.get("images") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            logger.warning("Batch response has no 'images' list")
+            return results
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+
+            index = entry.get("image")
+            if not isinstance(index, int) or not 1 <= index <= count:
+                logger.warning(f"Skipping batch entry for unknown image: {index}")
+                continue
+
+            highlights = entry.get("highlights")
+            if not isinstance(highlights, list):
+                continue
+
+            highlights = self._validate_highlights(
+                [h for h in highlights if isinstance(h, dict)]
+            )
+            results[index - 1] = highlights or None
+
+        found = sum(result is not None for result in results)
+        logger.debug(f"Parsed highlights for {found} of {count} images")
+        return results
+
     def _normalize_coordinate(self, value: Union[float, str, int]) -> float:
         """Normalize a coordinate value to ensure it's between 0 and 1.
 
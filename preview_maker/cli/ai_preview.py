@@ -11,7 +11,7 @@ import os
 import sys
 from pathlib import Path
 
-from preview_maker.ai import AIPreviewGenerator
+from preview_maker.ai import AIPreviewGenerator, AnalysisCache
 from preview_maker.core.logging import setup_logging
 
 
@@ -51,6 +51,17 @@ def parse_args():
         default="gemini-pro-vision",
         help="Gemini model to use. Default: gemini-pro-vision",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for cached analysis results, so unchanged images "
+        "aren't sent to the API again. Default: ~/.cache/preview_maker/analysis",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write cached analysis results.",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -118,11 +129,24 @@ def process_directory(
         if f.is_file() and f.suffix.lower() in image_extensions
     ]
 
-    # Process each image
+    # Process the images together, so their analysis is batched into as few
+    # API requests as possible
+    output_paths = [
+        output_dir / f"{image_file.stem}_preview{image_file.suffix}"
+        for image_file in image_files
+    ]
+    logging.info(f"Processing {len(image_files)} images in {input_dir}...")
+    # save_previews() handles failures per image, so one bad file only
+    # counts as a single failure, and doesn't keep the previews in memory
+    saved = generator.save_previews(image_files, output_paths)
+
     success_count = 0
-    for image_file in image_files:
-        if process_image(generator, image_file, output_dir):
+    for image_file, output_path, ok in zip(image_files, output_paths, saved):
+        if ok:
+            logging.info(f"Preview saved to {output_path}")
             success_count += 1
+        else:
+            logging.error(f"Failed to generate preview for {image_file}")
 
     return success_count, len(image_files)
 
@@ -145,7 +169,10 @@ def main():
             )
             return 1
 
-        generator = AIPreviewGenerator(api_key=api_key, model_name=args.model)
+        cache = None if args.no_cache else AnalysisCache(cache_dir=args.cache_dir)
+        generator = AIPreviewGenerator(
+            api_key=api_key, model_name=args.model, cache=cache
+        )
 
         # Process input path
         input_path = Path(args.input_path)
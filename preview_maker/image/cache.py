@@ -130,8 +130,9 @@ class CacheManager:
             cache_file = self._get_cache_file_path(image_path, cache_key)
 
             with self._cache_lock:
-                # Save image to cache
-                image.save(cache_file, "PNG")
+                # Save image to cache; cache files are short-lived, so favour
+                # encoding speed over file size (zlib level 1 instead of 6)
+                image.save(cache_file, "PNG", compress_level=1)
 
                 # Update cache info
                 self._cached_files.add(cache_file)
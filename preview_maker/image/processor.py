@@ -5,6 +5,7 @@ This module handles loading, transforming, and creating circular overlays
 for images using Pillow and Cairo.
 """
 
+import functools
 import os
 import sys
 import threading
@@ -59,6 +60,28 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _circle_layer(
+    radius: int, color: Union[str, Tuple[int, int, int, int]]
+) -> Image.Image:
+    """
+    Render a filled circle on a transparent square just large enough for it.
+
+    The overlays only change when the selection size does, so the rendered
+    layers are cached; callers must treat them as read-only.
+
+    Args:
+        radius: Radius of the circle
+        color: RGBA color of the circle
+
+    Returns:
+        RGBA PIL Image of size (2 * radius + 1, 2 * radius + 1)
+    """
+    layer = Image.new("RGBA", (2 * radius + 1, 2 * radius + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(layer).ellipse((0, 0, 2 * radius, 2 * radius), fill=color)
+    return layer
+
+
 class ImageProcessor:
     """
     Handles image processing operations.
@@ -136,7 +159,14 @@ class ImageProcessor:
         """
         try:
             logger.debug("Loading image from: %s", path)
-            return Image.open(path).convert("RGBA")
+            image = Image.open(path)
+            if image.mode == "RGBA":
+                # Already in the target mode: decode in place instead of
+                # letting convert() make a full copy
+                image.load()
+                return image
+            with image:
+                return image.convert("RGBA")
         except Exception as e:
             logger.error("Error loading image: %s", str(e))
             return None
@@ -217,6 +247,53 @@ class ImageProcessor:
             # Return a transparent image of the requested size
             return Image.new("RGBA", size, (0, 0, 0, 0))
 
+    def composite_circular_overlay(
+        self,
+        image: Image.Image,
+        position: Tuple[int, int],
+        radius: int,
+        color: Union[str, Tuple[int, int, int, int]] = (255, 0, 0, 128),
+    ) -> None:
+        """
+        Blend a circle onto an RGBA image in place.
+
+        Only the circle's bounding box is blended, so unlike compositing a
+        full-size create_circular_overlay() layer, the cost depends on the
+        size of the circle rather than that of the image. The circle itself
+        is rendered once per radius and color and then reused.
+
+        Args:
+            image: RGBA PIL Image to draw on
+            position: Center position of the circle as (x, y)
+            radius: Radius of the circle
+            color: RGBA color of the circle
+        """
+        x, y = position
+        left, top = x - radius, y - radius
+
+        # Clip the circle's bounding box to the image
+        box_left = max(0, left)
+        box_top = max(0, top)
+        box_right = min(image.width, x + radius + 1)
+        box_bottom = min(image.height, y + radius + 1)
+        if box_left >= box_right or box_top >= box_bottom:
+            return
+
+        try:
+            # Blend only the part of the circle that lies inside the image
+            image.alpha_composite(
+                _circle_layer(radius, color),
+                dest=(box_left, box_top),
+                source=(
+                    box_left - left,
+                    box_top - top,
+                    box_right - left,
+                    box_bottom - top,
+                ),
+            )
+        except Exception as e:
+            logger.error("Error compositing circular overlay: %s", str(e))
+
     def create_cairo_surface(self, image: Image.Image) -> Union[object, None]:
         """
         Convert a PIL Image to a Cairo surface.
@@ -125,18 +125,14 @@ class OverlayManager:
             # No overlays to apply
             return
 
-        # Make a copy of the image to avoid modifying the original
-        result_image = image.copy()
+        # Make an RGBA copy of the image to avoid modifying the original
+        result_image = image.convert("RGBA")
 
-        # Apply each overlay
+        # Blend each overlay into the copy; only the circle's area is touched
         for overlay_id, (x, y, radius) in self.overlays.items():
-            # Create circular overlay
-            overlay = self.image_processor.create_circular_overlay(
-                image.size[0], image.size[1], x, y, radius, color
+            self.image_processor.composite_circular_overlay(
+                result_image, (x, y), radius, color
             )
 
-            # Composite the overlay onto the image
-            result_image = Image.alpha_composite(result_image.convert("RGBA"), overlay)
-
         # Update the image view
         self.image_view.set_image(result_image)
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from PIL import Image
 from preview_maker.ai.analyzer import ImageAnalyzer
+from preview_maker.ai.cache import AnalysisCache
 
 
 @pytest.fixture
@@ -160,3 +161,115 @@ def test_build_prompt(analyzer, sample_image):
     assert "highlight areas of interest" in prompt
     assert "JSON" in prompt
     assert "highlights" in prompt
+
+
+def test_analyze_images(analyzer, sample_image):
+    """Test that analyze_images sends several images in one request."""
+    mock_response = MagicMock()
+    mock_response.text = """
+    {
+      "images": [
+        {
+          "image": 1,
+          "highlights": [
+            {"x": 0.5, "y": 0.5, "radius": 0.2, "description": "First"}
+          ]
+        },
+        {"image": 2, "highlights": []}
+      ]
+    }
+    """
+    analyzer._client.generate_content.return_value = mock_response
+
+    results = analyzer.analyze_images([sample_image, sample_image])
+
+    # Both images go out in a single request after the prompt
+    analyzer._client.generate_content.assert_called_once()
+    contents = analyzer._client.generate_content.call_args[0][0]
+    assert len(contents) == 3
+
+    assert results[0][0]["description"] == "First"
+    assert results[1] is None
+
+
+def test_analyze_images_error_handling(analyzer, sample_image):
+    """Test that a failed batch request yields None for each image."""
+    analyzer._client.generate_content.side_effect = Exception("API Error")
+
+    results = analyzer.analyze_images([sample_image] * 3)
+
+    assert results == [None, None, None]
+
+
+def test_analyze_image_cached(sample_image, tmp_path):
+    """Test that a cached image is not sent to the API again."""
+    analyzer = ImageAnalyzer(
+        client=MagicMock(), cache=AnalysisCache(cache_dir=tmp_path)
+    )
+    mock_response = MagicMock()
+    mock_response.text = '{"highlights": [{"x": 0.5, "y": 0.5, "radius": 0.2}]}'
+    analyzer._client.generate_content.return_value = mock_response
+
+    first = analyzer.analyze_image(sample_image)
+    second = analyzer.analyze_image(sample_image.copy())
+
+    analyzer._client.generate_content.assert_called_once()
+    assert second == first
+
+    # A different image still goes to the API
+    analyzer.analyze_image(Image.new("RGB", (100, 100), color=(0, 255, 0)))
+    assert analyzer._client.generate_content.call_count == 2
+
+
+def test_analyze_images_cached(sample_image, tmp_path):
+    """Test that batch analysis only sends images without a cached result."""
+    analyzer = ImageAnalyzer(
+        client=MagicMock(), cache=AnalysisCache(cache_dir=tmp_path)
+    )
+    mock_response = MagicMock()
+    mock_response.text = '{"highlights": [{"x": 0.5, "y": 0.5, "radius": 0.2}]}'
+    analyzer._client.generate_content.return_value = mock_response
+    analyzer.analyze_image(sample_image)
+
+    other = Image.new("RGB", (100, 100), color=(0, 255, 0))
+    results = analyzer.analyze_images([sample_image, other])
+
+    # Only the uncached image is sent, with the single-image prompt
+    assert analyzer._client.generate_content.call_count == 2
+    assert results[0] is not None
+    assert results[1] is not None
+
+
+def test_analyze_images_single_uncached_hashes_once(sample_image, tmp_path):
+    """Test that a lone uncached image in a batch is only hashed once."""
+    cache = AnalysisCache(cache_dir=tmp_path)
+    analyzer = ImageAnalyzer(client=MagicMock(), cache=cache)
+    mock_response = MagicMock()
+    mock_response.text = '{"highlights": [{"x": 0.5, "y": 0.5, "radius": 0.2}]}'
+    analyzer._client.generate_content.return_value = mock_response
+
+    with patch.object(cache, "make_key", wraps=cache.make_key) as make_key:
+        results = analyzer.analyze_images([sample_image])
+
+    make_key.assert_called_once()
+    assert results[0] is not None
+
+
+def test_analyze_images_cached_by_path(sample_image, tmp_path):
+    """Test that images with a known file are cached without their pixels."""
+    analyzer = ImageAnalyzer(
+        client=MagicMock(), cache=AnalysisCache(cache_dir=tmp_path)
+    )
+    mock_response = MagicMock()
+    mock_response.text = '{"highlights": [{"x": 0.5, "y": 0.5, "radius": 0.2}]}'
+    analyzer._client.generate_content.return_value = mock_response
+    path = tmp_path / "image.png"
+    sample_image.save(path)
+
+    analyzer.analyze_images([sample_image], [path])
+    with patch.object(Image.Image, "tobytes") as tobytes:
+        results = analyzer.analyze_images([sample_image], [path])
+
+    tobytes.assert_not_called()
+    analyzer._client.generate_content.assert_called_once()
+    assert results[0] is not None
@@ -0,0 +1,95 @@
+"""Tests for the AnalysisCache class."""
+
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from preview_maker.ai.cache import AnalysisCache, PROMPT_VERSION
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an AnalysisCache in a temporary directory."""
+    return AnalysisCache(cache_dir=tmp_path, max_entries=2)
+
+
+@pytest.fixture
+def highlights():
+    """Sample highlights as returned by the analyzer."""
+    return [{"x": 0.5, "y": 0.5, "radius": 0.2, "description": "Center"}]
+
+
+def test_make_key():
+    """Test that keys depend on the image content and the model."""
+    red = Image.new("RGB", (10, 10), color=(255, 0, 0))
+    blue = Image.new("RGB", (10, 10), color=(0, 0, 255))
+
+    key = AnalysisCache.make_key(red, "model")
+    assert key.endswith(PROMPT_VERSION)
+    assert key == AnalysisCache.make_key(red.copy(), "model")
+    assert key != AnalysisCache.make_key(blue, "model")
+    assert key != AnalysisCache.make_key(red, "other-model")
+    assert key != AnalysisCache.make_key(red.convert("RGBA"), "model")
+
+
+def test_make_key_from_file(tmp_path):
+    """Test that keys for a file don't depend on hashing the pixels."""
+    image = Image.new("RGB", (10, 10), color=(255, 0, 0))
+    path = tmp_path / "image.png"
+    image.save(path)
+
+    key = AnalysisCache.make_key(image, "model", path)
+    assert key.endswith(PROMPT_VERSION)
+    assert key == AnalysisCache.make_key(image, "model", str(path))
+    assert key != AnalysisCache.make_key(image, "model")
+
+    # Rewriting the file changes the key
+    os.utime(path, ns=(0, 0))
+    assert key != AnalysisCache.make_key(image, "model", path)
+
+
+def test_get_missing(cache):
+    """Test that an unknown key is a miss."""
+    assert cache.get("missing") is None
+
+
+def test_put_and_get(cache, highlights, tmp_path):
+    """Test that stored highlights are returned and written to disk."""
+    cache.put("key", highlights)
+
+    result = cache.get("key")
+    assert result == highlights
+
+    # Callers get copies, so they can't change the cached result
+    result[0]["x"] = 0.1
+    assert cache.get("key") == highlights
+
+    with open(tmp_path / "key.json", encoding="utf-8") as f:
+        assert json.load(f) == highlights
+
+
+def test_get_from_disk(cache, highlights, tmp_path):
+    """Test that results survive a new cache instance."""
+    cache.put("key", highlights)
+
+    new_cache = AnalysisCache(cache_dir=tmp_path)
+    assert new_cache.get("key") == highlights
+
+
+def test_memory_eviction(cache, highlights, tmp_path):
+    """Test that the in-memory LRU keeps at most max_entries results."""
+    cache.put("a", highlights)
+    cache.put("b", highlights)
+    cache.put("c", highlights)
+
+    assert list(cache._entries) == ["b", "c"]
+    # The evicted entry is still found on disk
+    assert cache.get("a") == highlights
+
+
+def test_corrupt_file(cache, tmp_path):
+    """Test that an unreadable cache file is treated as a miss."""
+    (tmp_path / "key.json").write_text("not json", encoding="utf-8")
+    assert cache.get("key") is None
@@ -7,6 +7,7 @@ from pathlib import Path
 from PIL import Image
 from preview_maker.ai.integration import AIPreviewGenerator
 from preview_maker.ai.analyzer import ImageAnalyzer
+from preview_maker.ai.cache import AnalysisCache
 
 
 @pytest.fixture
@@ -67,6 +68,40 @@ def generator(mock_analyzer, mock_processor):
     return generator
 
 
+def test_analysis_cache_is_opt_in(tmp_path):
+    """Test that results are only cached when a cache is passed in."""
+    assert AIPreviewGenerator(api_key="test_key").analyzer._cache is None
+
+    cache = AnalysisCache(cache_dir=tmp_path)
+    generator = AIPreviewGenerator(api_key="test_key", cache=cache)
+    assert generator.analyzer._cache is cache
+
+
+def test_generate_previews_uses_cache(tmp_path):
+    """Test that a second run over unchanged files is answered from the cache."""
+    generator = AIPreviewGenerator(
+        api_key="test_key", cache=AnalysisCache(cache_dir=tmp_path / "cache")
+    )
+    generator.analyzer._client = MagicMock()
+    response = MagicMock()
+    response.text = '{"highlights": [{"x": 0.5, "y": 0.5, "radius": 0.2}]}'
+    generator.analyzer._client.generate_content.return_value = response
+    generator.processor.create_circular_overlay = MagicMock(
+        side_effect=lambda image, position, radius: Image.new(
+            "RGBA", image.size, (0, 0, 0, 0)
+        )
+    )
+
+    image_path = tmp_path / "a.png"
+    Image.new("RGB", (200, 100), color=(255, 255, 255)).save(image_path)
+
+    for _ in range(2):
+        results = generator.generate_previews([image_path])
+        assert isinstance(results[0], Image.Image)
+
+    generator.analyzer._client.generate_content.assert_called_once()
+
+
 @patch("preview_maker.ai.integration.Path.exists")
 def test_generate_preview(mock_exists, generator, sample_image):
     """Test the generate_preview method."""
@@ -89,6 +124,82 @@ def test_generate_preview(mock_exists, generator, sample_image):
     assert generator.processor.create_circular_overlay.call_count == 2
 
 
+def test_generate_previews(generator, tmp_path):
+    """Test that generate_previews analyzes all images in one batch."""
+    image_paths = [tmp_path / "a.jpg", tmp_path / "missing.jpg", tmp_path / "b.jpg"]
+    for path in (image_paths[0], image_paths[2]):
+        Image.new("RGB", (200, 100), color=(255, 255, 255)).save(path)
+
+    generator.processor.load_image.side_effect = lambda path: Image.open(path)
+    highlights = generator.analyzer.analyze_image.return_value
+    generator.analyzer.analyze_images.return_value = [highlights, None]
+
+    output_paths = [tmp_path / "a_preview.png", None, tmp_path / "b_preview.png"]
+    results = generator.generate_previews(image_paths, output_paths)
+
+    # The missing image is skipped, the other two are analyzed together
+    generator.analyzer.analyze_images.assert_called_once()
+    assert len(generator.analyzer.analyze_images.call_args[0][0]) == 2
+    generator.analyzer.analyze_image.assert_not_called()
+
+    assert isinstance(results[0], Image.Image)
+    assert results[1] is None
+    assert results[2] is None  # No highlights found
+    assert output_paths[0].exists()
+    assert not output_paths[2].exists()
+
+
+def test_generate_previews_isolates_failures(generator, tmp_path):
+    """Test that one failing image does not abort the rest of the batch."""
+    image_paths = [tmp_path / f"{name}.jpg" for name in ("a", "b", "c")]
+    for path in image_paths:
+        Image.new("RGB", (200, 100), color=(255, 255, 255)).save(path)
+
+    def load_image(path):
+        if path.endswith("b.jpg"):
+            raise OSError("truncated file")
+        return Image.open(path)
+
+    generator.processor.load_image.side_effect = load_image
+    highlights = generator.analyzer.analyze_image.return_value
+    generator.analyzer.analyze_images.return_value = [highlights, highlights]
+
+    output_paths = [tmp_path / f"{path.stem}_preview.jpg" for path in image_paths]
+    results = generator.generate_previews(image_paths, output_paths)
+
+    assert isinstance(results[0], Image.Image)
+    assert results[1] is None
+    assert isinstance(results[2], Image.Image)
+    # The RGBA previews are saved as JPEG without their alpha channel
+    assert Image.open(output_paths[0]).mode == "RGB"
+    assert not output_paths[1].exists()
+    assert output_paths[2].exists()
+
+
+def test_save_previews(generator, tmp_path):
+    """Test that save_previews reports success and releases the sources."""
+    image_paths = [tmp_path / "a.jpg", tmp_path / "b.jpg"]
+    for path in image_paths:
+        Image.new("RGB", (200, 100), color=(255, 255, 255)).save(path)
+
+    loaded = []
+
+    def load_image(path):
+        loaded.append(Image.open(path))
+        return loaded[-1]
+
+    generator.processor.load_image.side_effect = load_image
+    highlights = generator.analyzer.analyze_image.return_value
+    generator.analyzer.analyze_images.return_value = [highlights, None]
+
+    output_paths = [tmp_path / "a_preview.jpg", tmp_path / "b_preview.jpg"]
+    assert generator.save_previews(image_paths, output_paths) == [True, False]
+    assert output_paths[0].exists()
+
+    # The source images are closed once their batch is done
+    assert all(image.fp is None for image in loaded)
+
+
 @patch("preview_maker.ai.integration.Path.exists")
 def test_generate_preview_with_output(mock_exists, generator, tmp_path):
     """Test the generate_preview method with output path."""
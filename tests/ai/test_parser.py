@@ -180,3 +180,39 @@ def test_validate_highlights(parser):
     assert result[1]["y"] == 0.0  # Normalized from -0.5
     assert result[1]["radius"] == 0.5  # Normalized from 0.8
     assert result[1]["description"] == "Invalid but normalizable"
+
+
+def test_parse_batch_response(parser):
+    """Test splitting a multi-image response into per-image highlights."""
+    response = """
+    ```json
+    {
+      "images": [
+        {
+          "image": 2,
+          "highlights": [
+            {"x": 0.7, "y": 0.5, "radius": 0.15, "description": "A butterfly"}
+          ]
+        },
+        {
+          "image": 1,
+          "highlights": [
+            {"x": 0.3, "y": 0.4, "radius": 0.1, "description": "A red flower"}
+          ]
+        },
+        {"image": 7, "highlights": [{"x": 0.1, "y": 0.1}]}
+      ]
+    }
+    ```
+    """
+    results = parser.parse_batch_response(response, 3)
+
+    assert len(results) == 3
+    assert results[0][0]["description"] == "A red flower"
+    assert results[1][0]["x"] == 0.7
+    assert results[2] is None
+
+
+def test_parse_invalid_batch_response(parser, invalid_response):
+    """Test that an unusable batch response yields None for every image."""
+    assert parser.parse_batch_response(invalid_response, 2) == [None, None]
@@ -3,10 +3,12 @@
 import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 from pathlib import Path
 
 from PIL import Image
+from preview_maker.ai.cache import AnalysisCache
+from preview_maker.ai.integration import AIPreviewGenerator
 from preview_maker.cli.ai_preview import main, process_image, process_directory
 
 
@@ -22,6 +24,7 @@ def mock_generator():
     """Create a mock AIPreviewGenerator."""
     mock = MagicMock()
     mock.generate_preview.return_value = Image.new("RGB", (100, 100))
+    mock.save_previews.side_effect = lambda paths, outputs: [True for _ in paths]
     return mock
 
 
@@ -62,9 +65,66 @@ def test_process_directory(mock_generator, tmp_path, sample_image):
     # Check the results
     assert success_count == 3
     assert total_count == 3
-    assert mock_generator.generate_preview.call_count == 3
     assert output_dir.exists()
 
+    # All images are handed over in one call, so their analysis is batched
+    mock_generator.save_previews.assert_called_once()
+    paths, outputs = mock_generator.save_previews.call_args[0]
+    assert sorted(p.name for p in paths) == ["test0.jpg", "test1.jpg", "test2.jpg"]
+    assert sorted(p.name for p in outputs) == [
+        "test0_preview.jpg",
+        "test1_preview.jpg",
+        "test2_preview.jpg",
+    ]
+
+
+def test_process_directory_partial_failure(mock_generator, tmp_path, sample_image):
+    """Test that images without a preview are counted as failures."""
+    for i in range(2):
+        sample_image.save(tmp_path / f"test{i}.jpg")
+
+    mock_generator.save_previews.side_effect = lambda paths, outputs: [True, False]
+
+    success_count, total_count = process_directory(
+        mock_generator, tmp_path, tmp_path / "output"
+    )
+
+    assert success_count == 1
+    assert total_count == 2
+
+
+def test_process_directory_isolates_failures(tmp_path, sample_image):
+    """Test that one failing image does not abort the whole directory."""
+    for i in range(3):
+        sample_image.save(tmp_path / f"test{i}.jpg")
+
+    generator = AIPreviewGenerator(api_key="test_key")
+    generator.analyzer = MagicMock()
+    generator.analyzer.analyze_images.side_effect = lambda images, paths: [
+        [{"x": 0.5, "y": 0.5, "radius": 0.1}] for _ in images
+    ]
+    generator.analyzer.convert_highlights_to_pixels.return_value = [
+        {"x": 50, "y": 50, "radius": 10}
+    ]
+
+    def failing_overlay(image, position, radius):
+        # Fail on the second image only
+        failing_overlay.call_count += 1
+        if failing_overlay.call_count == 2:
+            raise ValueError("broken overlay")
+        return Image.new("RGBA", image.size, (0, 0, 0, 0))
+
+    failing_overlay.call_count = 0
+    generator.processor.create_circular_overlay = failing_overlay
+
+    output_dir = tmp_path / "output"
+    success_count, total_count = process_directory(generator, tmp_path, output_dir)
+
+    assert success_count == 2
+    assert total_count == 3
+    assert failing_overlay.call_count == 3
+    assert len(list(output_dir.glob("*_preview.jpg"))) == 2
+
 
 def test_process_image_failure(mock_generator, tmp_path):
     """Test handling of image processing failure."""
@@ -110,7 +170,7 @@ def test_main_single_file(
             assert result == 0
             mock_setup_logging.assert_called_once()
             mock_generator_class.assert_called_once_with(
-                api_key="test_api_key", model_name="gemini-pro-vision"
+                api_key="test_api_key", model_name="gemini-pro-vision", cache=ANY
             )
             mock_process_image.assert_called_once()
 
@@ -150,11 +210,37 @@ def test_main_directory(
             assert result == 0
             mock_setup_logging.assert_called_once()
             mock_generator_class.assert_called_once_with(
-                api_key="test_api_key", model_name="gemini-pro-vision"
+                api_key="test_api_key", model_name="gemini-pro-vision", cache=ANY
             )
             mock_process_directory.assert_called_once()
 
 
+@pytest.mark.parametrize("extra_args", [[], ["--no-cache"]])
+@patch("preview_maker.cli.ai_preview.AIPreviewGenerator")
+@patch("preview_maker.cli.ai_preview.setup_logging")
+@patch("preview_maker.cli.ai_preview.process_image")
+def test_main_analysis_cache(
+    mock_process_image, mock_setup_logging, mock_generator_class, tmp_path, extra_args
+):
+    """Test that the analysis cache is used unless --no-cache is given."""
+    mock_process_image.return_value = True
+    test_file = tmp_path / "test.jpg"
+    test_file.touch()
+    cache_dir = tmp_path / "cache"
+
+    test_args = ["ai_preview.py", str(test_file), "-k", "test_api_key"]
+    test_args += ["--cache-dir", str(cache_dir)] + extra_args
+    with patch.object(sys, "argv", test_args):
+        assert main() == 0
+
+    cache = mock_generator_class.call_args.kwargs["cache"]
+    if extra_args:
+        assert cache is None
+    else:
+        assert isinstance(cache, AnalysisCache)
+        assert cache._cache_dir == cache_dir
+
+
 @patch("preview_maker.cli.ai_preview.AIPreviewGenerator")
 @patch("preview_maker.cli.ai_preview.setup_logging")
 def test_main_no_api_key(mock_setup_logging, mock_generator_class):
@@ -58,6 +58,20 @@ class TestImageProcessor:
         assert isinstance(image, Image.Image)
         assert image.size == (100, 100)
 
+    def test_load_image_sync_rgba(self, processor):
+        """Test that RGBA images are loaded without a conversion."""
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+            Image.new("RGBA", (100, 100), color=(255, 0, 0, 128)).save(tmp.name)
+
+        try:
+            image = processor._load_image_sync(tmp.name)
+
+            assert image is not None
+            assert image.mode == "RGBA"
+            assert image.getpixel((0, 0)) == (255, 0, 0, 128)
+        finally:
+            os.unlink(tmp.name)
+
     def test_load_image_async(self, processor, temp_image_path):
         """Test asynchronous image loading."""
         # Create a counter and a lock to track callback calls
@@ -107,9 +121,7 @@ class TestImageProcessor:
         radius = 50
         color = (255, 0, 0, 128)  # Red with 50% transparency
 
-        overlay = processor.create_circular_overlay(
-            size, position, radius, color
-        )
+        overlay = processor.create_circular_overlay(size, position, radius, color)
 
         # Check that we got an image back
         assert overlay is not None
@@ -126,6 +138,42 @@ class TestImageProcessor:
         corner_pixel = overlay.getpixel((0, 0))
         assert corner_pixel[3] == 0  # Alpha should be zero (transparent)
 
+    def test_composite_circular_overlay(self, processor):
+        """Test that blending a circle matches compositing a full-size overlay."""
+        base = Image.new("RGBA", (100, 100), color=(255, 255, 255, 255))
+        color = (255, 0, 0, 128)
+
+        # Include circles that are clipped by the image edges
+        for position, radius in (((50, 50), 20), ((5, 90), 15), ((120, 50), 30)):
+            expected = Image.alpha_composite(
+                base,
+                processor.create_circular_overlay(base.size, position, radius, color),
+            )
+
+            result = base.copy()
+            processor.composite_circular_overlay(result, position, radius, color)
+
+            assert result.tobytes() == expected.tobytes()
+
+    def test_composite_circular_overlay_outside(self, processor):
+        """Test that a circle outside the image leaves it unchanged."""
+        image = Image.new("RGBA", (100, 100), color=(255, 255, 255, 255))
+        processor.composite_circular_overlay(image, (200, 200), 10)
+        assert image.getextrema() == ((255, 255),) * 4
+
+    def test_composite_circular_overlay_reuses_circle(self, processor):
+        """Test that the same circle is only rendered once."""
+        from preview_maker.image.processor import _circle_layer
+
+        _circle_layer.cache_clear()
+        for _ in range(3):
+            image = Image.new("RGBA", (100, 100), color=(255, 255, 255, 255))
+            processor.composite_circular_overlay(image, (50, 50), 10, (0, 0, 255, 255))
+
+        info = _circle_layer.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
     def test_resize_image(self, processor, test_image):
         """Test resizing an image."""
         # Resize the image
@@ -154,6 +202,4 @@ class TestImageProcessor:
 
         print(f"\nDEBUG: HEADLESS_MODE = {HEADLESS_MODE}")
         # In test environment, headless mode should be True
-        assert (
-            HEADLESS_MODE is True
-        ), "Test environment should be in headless mode"
+        assert HEADLESS_MODE is True, "Test environment should be in headless mode"
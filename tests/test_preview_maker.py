@@ -0,0 +1,51 @@
+"""Tests for the main() entry point of the preview_maker.py application."""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+APP_PATH = Path(__file__).resolve().parent.parent / "preview_maker.py"
+
+
+@pytest.fixture
+def app_module():
+    """Load preview_maker.py with GTK and its helper modules mocked."""
+    gtk = mock.MagicMock()
+    gtk.Application = type("Application", (), {})
+    gtk.Widget = type("Widget", (), {})
+    repository = mock.MagicMock(Gtk=gtk)
+    gi = mock.MagicMock(repository=repository)
+
+    modules = {
+        "gi": gi,
+        "gi.repository": repository,
+        "gemini_analyzer": mock.MagicMock(),
+        "image_processor": mock.MagicMock(),
+        "config": mock.MagicMock(),
+    }
+    with mock.patch.dict(sys.modules, modules):
+        spec = importlib.util.spec_from_file_location("preview_maker_app", APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+@pytest.mark.parametrize(
+    "env_level, expected", [("debug", "DEBUG"), ("not-a-level", "WARNING")]
+)
+def test_main_log_level(app_module, monkeypatch, caplog, env_level, expected):
+    """Test that an invalid PREVIEW_MAKER_LOG falls back to WARNING."""
+    monkeypatch.setenv("PREVIEW_MAKER_LOG", env_level)
+    monkeypatch.setattr(app_module, "PreviewMaker", mock.MagicMock())
+    monkeypatch.setattr(app_module, "_log_pillow_backend", lambda: None)
+
+    with mock.patch.object(logging, "basicConfig") as basic_config:
+        app_module.main()
+
+    assert basic_config.call_args.kwargs["level"] == expected
+    warned = "Unknown log level" in caplog.text
+    assert warned == (expected != env_level.upper())